@@ -26,6 +26,9 @@ _SPLIT_QUOTED_STRING_PATTERN = re.compile(r"^\s*\"")
 _UNQUOTED_NUMBERS_PATTERN = re.compile(r"(?P<attribute_g>\s+(?P<name_g>[\w-]+)=\s*(?P<value_g>-?\d+(?:\.\d+)?))")
 _SPACES_BEFORE_COMMA_PATTERN = re.compile(r"^#EXTINF:(?P<duration_g>[-0-9\.]+)(?P<spaces_g>\s)+,(?P<name_g>.*)")
 
+# Names of the well-known attributes, to tell without an exception whether a name needs normalizing
+_IPTV_ATTR_NAMES = frozenset(attr.value for attr in IPTVAttr)
+
 
 class M3UDoctor:
     """Fixes structural issues in M3U file rows.
@@ -252,6 +255,36 @@ class IPTVChannelDoctor:
             IPTVChannelDoctor._normalize_attributes_name(new_chan, attr)
         return new_chan
 
+    @staticmethod
+    def needs_sanitize(chan: IPTVChannel) -> bool:
+        """Check whether sanitize() would change an IPTV channel.
+
+        Looks for the issues fixed by sanitize() without copying the channel,
+        and stops at the first one found.
+
+        Args:
+            chan: The IPTVChannel to check.
+
+        Returns:
+            True if at least one fix applies to the channel, False otherwise.
+
+        Example:
+            >>> IPTVChannelDoctor.needs_sanitize(IPTVChannel(attributes={"tvg-ID": "123"}))
+            True
+            >>> IPTVChannelDoctor.needs_sanitize(IPTVChannel(attributes={"tvg-id": "123"}))
+            False
+        """
+        logo_key = IPTVAttr.TVG_LOGO.value
+        for name, value in chan.attributes.items():
+            if name == logo_key:
+                if urllib.parse.quote(value, safe=':/%?&=') != value:
+                    return True
+            elif "," in value:
+                return True
+            if name not in _IPTV_ATTR_NAMES and name.lower() in _IPTV_ATTR_NAMES:
+                return True
+        return False
+
 
 class M3UPlaylistDoctor:
     """Applies sanitization fixes to entire M3U playlists.
@@ -286,6 +319,25 @@ class M3UPlaylistDoctor:
             new_playlist.append_channel(IPTVChannelDoctor.sanitize(chan))
         return new_playlist
 
+    @staticmethod
+    def needs_sanitize(playlist: M3UPlaylist) -> bool:
+        """Check whether sanitize() would change any channel of a playlist.
+
+        Stops at the first channel that needs fixing, so a clean playlist can
+        skip sanitize() and the copy of every channel it makes.
+
+        Args:
+            playlist: The M3UPlaylist to check.
+
+        Returns:
+            True if at least one channel needs fixing, False otherwise.
+
+        Example:
+            >>> if M3UPlaylistDoctor.needs_sanitize(pl):
+            ...     pl = M3UPlaylistDoctor.sanitize(pl)
+        """
+        return any(IPTVChannelDoctor.needs_sanitize(chan) for chan in playlist.get_channels())
+
 
 if __name__ == "__main__":
     pass
@@ -22,11 +22,7 @@ import multiprocessing as mp
 import re
 import typing
 from multiprocessing.pool import AsyncResult
-from typing import List, Dict, Tuple, Optional, Union, Any
-
-import jsonschema
-import requests
-from requests import RequestException
+from typing import List, Dict, Tuple, Optional, Union, Any, TextIO
 
 import ipytv.channel
 from ipytv import m3u
@@ -94,7 +90,7 @@ class M3UPlaylist:
             >>> playlist.length()
             0
         """
-        return len(self.get_channels()) if self.get_channels() is not None else 0
+        return len(self._channels)
 
     def _check_attribute(self, name: str) -> None:
         """Check if an attribute exists, raise exception if not found.
@@ -488,9 +484,21 @@ class M3UPlaylist:
         Returns:
             True if any field matches, False otherwise.
         """
-        channel_fields = M3UPlaylist._extract_fields(ch)
         compiled_regex = _get_compiled_regex(regex, case_sensitive)
-        for field in channel_fields:
+        return M3UPlaylist._match_all_compiled(ch, compiled_regex)
+
+    @staticmethod
+    def _match_all_compiled(ch: IPTVChannel, compiled_regex: re.Pattern) -> bool:
+        """Check if any field in a channel matches the compiled regex.
+
+        Args:
+            ch: The channel to search in.
+            compiled_regex: The compiled regular expression pattern.
+
+        Returns:
+            True if any field matches, False otherwise.
+        """
+        for field in M3UPlaylist._extract_fields(ch):
             if M3UPlaylist._match_single_compiled(ch, compiled_regex, field):
                 return True
         return False
@@ -568,19 +576,18 @@ class M3UPlaylist:
             >>> # Search in multiple fields
             >>> results = playlist.search(r"HD", where=["name", "attributes.group-title"])
         """
+        # The regex is compiled (and the fields normalized) once for the whole scan
+        compiled_regex = _get_compiled_regex(regex, case_sensitive)
+        if where is None:
+            return [ch for ch in self.get_channels() if self._match_all_compiled(ch, compiled_regex)]
+        fields = where if isinstance(where, list) else [where]
         output_list: List[IPTVChannel] = []
         for ch in self.get_channels():
-            if where is None:
-                if self._match_all(ch, regex, case_sensitive):
+            for field in fields:
+                if self._match_single_compiled(ch, compiled_regex, field):
                     output_list.append(ch)
-            else:
-                if not isinstance(where, list):
-                    where = [where]
-                for w in where:
-                    if self._match_single(ch, regex, w, case_sensitive):
-                        output_list.append(ch)
-                        # One match is enough
-                        break
+                    # One match is enough
+                    break
         return output_list
 
     def to_m3u_plus_playlist(self) -> str:
@@ -596,10 +603,9 @@ class M3UPlaylist:
             #EXTINF:-1 tvg-id="1",Channel 1
             http://example.com/stream1
         """
-        out = f"{self._build_header()}\n"
-        for channel in self.get_channels():
-            out += channel.to_m3u_plus_playlist_entry()
-        return out
+        entries = [f"{self._build_header()}\n"]
+        entries.extend(channel.to_m3u_plus_playlist_entry() for channel in self.get_channels())
+        return "".join(entries)
 
     def to_m3u8_playlist(self) -> str:
         """Convert the playlist to standard M3U8 format.
@@ -614,10 +620,9 @@ class M3UPlaylist:
             #EXTINF:-1,Channel 1
             http://example.com/stream1
         """
-        out = f"{m3u.M3U_HEADER_TAG}\n"
-        for channel in self.get_channels():
-            out += channel.to_m3u8_playlist_entry()
-        return out
+        entries = [f"{m3u.M3U_HEADER_TAG}\n"]
+        entries.extend(channel.to_m3u8_playlist_entry() for channel in self.get_channels())
+        return "".join(entries)
 
     def __to_dict(self) -> Dict[str, Any]:
         """Convert the playlist to a dictionary representation.
@@ -645,6 +650,58 @@ class M3UPlaylist:
         """
         return json.dumps(self.__to_dict())
 
+    def write_m3u_plus_playlist(self, file: TextIO) -> None:
+        """Write the playlist in M3U Plus format to a text file, one channel at a time.
+
+        The output is the same as to_m3u_plus_playlist(), but it's never held
+        in memory as a whole.
+
+        Args:
+            file: A text file (or any object with a write method) open for writing.
+
+        Example:
+            >>> with open("my_channels.m3u", "w", encoding="utf-8") as f:
+            ...     playlist.write_m3u_plus_playlist(f)
+        """
+        file.write(f"{self._build_header()}\n")
+        file.writelines(channel.to_m3u_plus_playlist_entry() for channel in self.get_channels())
+
+    def write_m3u8_playlist(self, file: TextIO) -> None:
+        """Write the playlist in M3U8 format to a text file, one channel at a time.
+
+        The output is the same as to_m3u8_playlist(), but it's never held
+        in memory as a whole.
+
+        Args:
+            file: A text file (or any object with a write method) open for writing.
+
+        Example:
+            >>> with open("my_channels.m3u8", "w", encoding="utf-8") as f:
+            ...     playlist.write_m3u8_playlist(f)
+        """
+        file.write(f"{m3u.M3U_HEADER_TAG}\n")
+        file.writelines(channel.to_m3u8_playlist_entry() for channel in self.get_channels())
+
+    def write_json_playlist(self, file: TextIO) -> None:
+        """Write the playlist in JSON format to a text file, one channel at a time.
+
+        The output is the same as to_json_playlist(), but it's never held
+        in memory as a whole.
+
+        Args:
+            file: A text file (or any object with a write method) open for writing.
+
+        Example:
+            >>> with open("my_channels.json", "w", encoding="utf-8") as f:
+            ...     playlist.write_json_playlist(f)
+        """
+        file.write(f'{{"attributes": {json.dumps(self.get_attributes())}, "channels": [')
+        file.writelines(
+            f", {channel.to_json()}" if i else channel.to_json()
+            for i, channel in enumerate(self.get_channels())
+        )
+        file.write("]}")
+
     def copy(self) -> 'M3UPlaylist':
         """Create a deep copy of the playlist.
 
@@ -872,6 +929,9 @@ def loadu(url: str) -> 'M3UPlaylist':
     if not isinstance(url, str):
         log.error("expected %s, got %s", type(''), type(url))
         raise WrongTypeException("Wrong type: string expected")
+    # requests takes longer to import than the rest of ipytv: only pay
+    # for it when a URL is actually loaded
+    import requests
     try:
         response = requests.get(url, timeout=10)
         if response.ok:
@@ -879,7 +939,7 @@ def loadu(url: str) -> 'M3UPlaylist':
         raise URLException(
             f"Failure while opening {url}.\nResponse status code: {response.status_code}"
         )
-    except RequestException as exception:
+    except requests.RequestException as exception:
         log.error(
             "failure while opening %s: %s",
             url,
@@ -911,6 +971,8 @@ def loadj(json_dict: typing.Dict[str, Any]) -> 'M3UPlaylist':
     if not isinstance(json_dict, dict):
         log.error("expected %s, got %s", dict, type(json_dict))
         raise WrongTypeException("Wrong type: json dict expected")
+    # Imported on first use, like requests in loadu()
+    import jsonschema
     with open("ipytv/resources/schema.json", "r", encoding="utf-8") as schema_file:
         schema = json.load(schema_file)
         try:
@@ -14,6 +14,7 @@ Functions:
     extract_series: Create multiple playlists by grouping series episodes
     is_episode_from_series: Check if a channel name looks like a series episode
     extract_show_name: Extract show name by removing episode information
+    find_episode_pattern: Find the episode pattern matching a channel name
 """
 import re
 from typing import Dict, Tuple, Optional
@@ -31,14 +32,26 @@ _SEASON_AND_EPISODE_PATTERN_2 = re.compile(r'\s+(\d{1,2})[x.](\d+)(?:\s+|$).*',
 _SEASON_AND_EPISODE_PATTERN_3 = re.compile(r'(?<![0-9])\.(\d+)$', re.IGNORECASE)
 
 
-def _find_episode_pattern(channel_name: str) -> Optional[re.Pattern]:
+def find_episode_pattern(channel_name: str) -> Optional[re.Pattern]:
     """Find which episode pattern matches the channel name.
 
+    Both is_episode_from_series and extract_show_name rely on this lookup;
+    calling it directly runs the patterns only once when both answers are
+    needed.
+
     Args:
         channel_name: The channel name to check.
 
     Returns:
-        The matching compiled pattern, or None if no pattern matches.
+        The matching compiled pattern, or None if no pattern matches. Its
+        sub("", channel_name) removes the episode information.
+
+    Example:
+        >>> pattern = find_episode_pattern("Breaking Bad S01E01 Pilot")
+        >>> pattern.sub("", "Breaking Bad S01E01 Pilot").strip()
+        'Breaking Bad'
+        >>> find_episode_pattern("News Channel") is None
+        True
     """
     if _SEASON_AND_EPISODE_PATTERN_1.search(channel_name):
         return _SEASON_AND_EPISODE_PATTERN_1
@@ -81,12 +94,15 @@ def extract_series(playlist: M3UPlaylist, exclude_single: bool = False) -> Tuple
     not_series_playlist.add_attributes(playlist.get_attributes())
 
     for channel in playlist:
+        # The matching pattern is looked up once, both to tell episodes
+        # apart and to strip the episode information from their name
+        pattern = find_episode_pattern(channel.name)
         # If it doesn't look like a series, add to non-series playlist
-        if not is_episode_from_series(channel.name):
+        if pattern is None:
             not_series_playlist.append_channel(channel)
             continue
 
-        show_name = extract_show_name(channel.name).lower()
+        show_name = pattern.sub("", channel.name).strip().lower()
         if show_name not in title_playlist_map:
             title_playlist_map[show_name] = M3UPlaylist()
             title_playlist_map[show_name].add_attributes(playlist.get_attributes())
@@ -122,7 +138,7 @@ def is_episode_from_series(channel_name: str) -> bool:
         >>> is_episode_from_series("Video 1920x1080")  # Resolution, not episode
         False
     """
-    return _find_episode_pattern(channel_name) is not None
+    return find_episode_pattern(channel_name) is not None
 
 
 def extract_show_name(channel_name: str) -> str:
@@ -148,7 +164,7 @@ def extract_show_name(channel_name: str) -> str:
         >>> extract_show_name("Regular Movie")  # No episode pattern
         'Regular Movie'
     """
-    pattern = _find_episode_pattern(channel_name)
+    pattern = find_episode_pattern(channel_name)
     if pattern:
         return pattern.sub("", channel_name).strip()
     return channel_name.strip()
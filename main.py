@@ -6,15 +6,27 @@ A comprehensive tool for loading, analyzing, and managing IPTV playlists
 with URL history, tag parsing, multiple playlist support, and group filtering.
 """
 
+import functools
+import hashlib
+import importlib.util
+import io
 import sys
 import os
+import re
+import threading
 import time
-from typing import Dict, List, Optional
+import urllib.request
 import json
-import pickle
-from typing import Dict, List, Optional, Set, Any
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 from pathlib import Path
+from types import SimpleNamespace
+from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 # Add color support
 try:
@@ -29,31 +41,329 @@ except ImportError:
     Fore = Back = Style = DummyColors()
     COLORS_ENABLED = False
 
-# Rich for advanced formatting
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-    from rich.panel import Panel
-    from rich.layout import Layout
-    from rich.text import Text
-    from rich.prompt import Prompt, Confirm, IntPrompt
+# Rich for advanced formatting (imported on first use, see _rich)
+RICH_AVAILABLE = importlib.util.find_spec('rich') is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _rich() -> SimpleNamespace:
+    """Import the Rich components used by the manager, only once and only when needed.
+
+    Without Rich an empty namespace is returned: callers only touch its
+    members inside their RICH_AVAILABLE branches.
+    """
+    if not RICH_AVAILABLE:
+        return SimpleNamespace()
     from rich import box
-    from rich.markdown import Markdown
-    from rich.syntax import Syntax
     from rich.columns import Columns
-    RICH_AVAILABLE = True
+    from rich.console import Console, Group
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from rich.prompt import Prompt, Confirm, IntPrompt
+    from rich.table import Table
+    from rich.text import Text
+    return SimpleNamespace(
+        box=box, Columns=Columns, Console=Console, Group=Group, Panel=Panel, Progress=Progress,
+        SpinnerColumn=SpinnerColumn, TextColumn=TextColumn, BarColumn=BarColumn,
+        TaskProgressColumn=TaskProgressColumn, Prompt=Prompt, Confirm=Confirm,
+        IntPrompt=IntPrompt, Table=Table, Text=Text
+    )
+
+
+# orjson for faster (de)serialization of the history and saved playlists
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    RICH_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # IPyTV imports
-from ipytv import playlist
+from ipytv import m3u, playlist
+from ipytv.channel import from_playlist_entry
 from ipytv.doctor import M3UDoctor, M3UPlaylistDoctor, IPTVChannelDoctor
-from ipytv.utils import extract_series, is_episode_from_series, extract_show_name
+from ipytv.utils import find_episode_pattern
 from ipytv.channel import IPTVChannel, IPTVAttr
 from ipytv.exceptions import URLException, MalformedPlaylistException
 from ipytv.playlist import M3UPlaylist
 
+# Streaming download settings used by _load_streaming
+STREAM_TIMEOUT = 10
+STREAM_BUFFER_SIZE = 1 << 16
+
+# Number of loaded playlists kept, with their source version, so that loading
+# an unchanged URL again reuses them instead of parsing and sanitizing anew
+MAX_REUSED_PLAYLISTS = 8
+
+# Number of downloads kept in the playlist cache, the least recently used
+# ones being deleted first
+MAX_CACHED_PLAYLISTS = 16
+
+# Maximum number of playlists downloaded at the same time by load_multiple_urls.
+# The workers mostly wait on the network, so this is sized like a connection pool,
+# not like the number of CPU cores.
+MAX_PARALLEL_LOADS = 32
+
+# Number of URLs kept in the history
+MAX_HISTORY_ENTRIES = 50
+
+# Write buffer used when exporting playlists to disk
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Label shown in place of M3UPlaylist.NO_GROUP_KEY
+NO_GROUP_LABEL = "[No Group]"
+
+# Attribute values up to this length are interned when a playlist is loaded
+INTERN_MAX_LENGTH = 64
+
+# Main menu entries shared by the Rich and the plain-text menus: key,
+# description and the Rich status column, formatted with the numbers of
+# history entries and loaded playlists
+_MENU_ITEMS = (
+    ("1", "📥 Load Single Playlist", "Always"),
+    ("2", "📜 Load from History", "{history} saved"),
+    ("3", "📚 Load Multiple URLs", "Batch mode"),
+    ("4", "📊 Playlist Overview", "Current only"),
+    ("5", "📁 Group Analysis", "Top 10 groups"),
+    ("6", "🏷️ TVG Tag Analysis", "Tag stats"),
+    ("7", "💾 Smart Export", "Group filter"),
+    ("8", "🔀 Manage Playlists", "{loaded} loaded"),
+    ("9", "🔄 Merge Playlists", "{loaded} available"),
+    ("10", "🎭 Series Detection", "Auto-detect"),
+    ("11", "🔍 Search Channels", "Regex support"),
+    ("12", "❓ Help & Guide", "Documentation"),
+    ("q", "🚪 Exit Manager", "Safe exit")
+)
+
+# Plain-text output fragments, formatted once since the colors never change
+_PLAYLIST_ROW_FMT = f"{Fore.WHITE}%2d. {Fore.CYAN}%s {Fore.GREEN}[%s channels]{Style.RESET_ALL}"
+_METRIC_ROW_FMT = f"{Fore.WHITE}%s: {Fore.YELLOW}%s{Style.RESET_ALL}"
+_SUCCESS_FMT = f"{Fore.GREEN}✅ %s{Style.RESET_ALL}"
+_ERROR_FMT = f"{Fore.RED}❌ %s{Style.RESET_ALL}"
+_WARNING_FMT = f"{Fore.YELLOW}⚠️  %s{Style.RESET_ALL}"
+_INFO_FMT = f"{Fore.BLUE}ℹ️  %s{Style.RESET_ALL}"
+_SIMPLE_MENU_LINES = tuple(
+    (key, f"{Fore.CYAN}{key}.{Style.RESET_ALL} {desc}")
+    for key, desc, _ in _MENU_ITEMS
+)
+_NEEDS_PLAYLIST_STATUS = f"{Fore.RED} [needs playlist]{Style.RESET_ALL}"
+_NEEDS_MULTI_STATUS = f"{Fore.RED} [need 2+ playlists]{Style.RESET_ALL}"
+_SIMPLE_MENU_HEADER = f"{Fore.MAGENTA}{Style.BRIGHT}🎬 ENHANCED IPTV PLAYLIST MANAGER{Style.RESET_ALL}\n"
+_SIMPLE_CURRENT_FMT = f"{Fore.GREEN}✓ Current Playlist: %s channels{Style.RESET_ALL}"
+_SIMPLE_NO_PLAYLIST = f"{Fore.YELLOW}⚠ No playlist loaded{Style.RESET_ALL}"
+_SIMPLE_LOADED_FMT = f"{Fore.BLUE}📚 Loaded: %d playlists{Style.RESET_ALL}"
+_SIMPLE_HISTORY_FMT = f"{Fore.CYAN}📜 History: %d/%d successful{Style.RESET_ALL}"
+_SIMPLE_MENU_TITLE = f"\n{Fore.CYAN}{Style.BRIGHT}🎯 Main Menu:{Style.RESET_ALL}\n"
+_SIMPLE_MENU_FOOTER = f"\n{Fore.YELLOW}💡 Pro tip: Use option 7 for advanced group-based exporting{Style.RESET_ALL}\n"
+
+# Help guide, in Rich markup and in plain text
+_RICH_HELP_TEXT = """
+[b]🎯 Enhanced IPTV Playlist Manager - Complete Guide[/b]
+
+[bold cyan]🚀 Core Features:[/bold cyan]
+• [green]Smart Loading[/green]: Load from URLs, history, or multiple sources
+• [green]Advanced Analysis[/green]: Group statistics, TVG tag analysis, series detection
+• [green]Smart Exporting[/green]: Filter by groups with multi-select interface
+• [green]Playlist Management[/green]: Merge, switch between, and manage multiple playlists
+
+[bold cyan]💾 Export Features (Option 7):[/bold cyan]
+• [yellow]Multi-Column Group Display[/yellow]: View all groups in organized columns
+• [yellow]Flexible Selection[/yellow]: Use numbers, ranges (1-5), or toggle existing selections
+• [yellow]Smart Filtering[/yellow]: Include or exclude selected groups
+• [yellow]Export Summary[/yellow]: See exactly what will be exported before saving
+
+[bold cyan]🎮 Quick Start:[/bold cyan]
+1. Load a playlist (option 1 or 2)
+2. Analyze it (options 4-6) 
+3. Export filtered content (option 7)
+4. Manage multiple sources (options 8-9)
+
+[bold cyan]🔗 Sample URLs:[/bold cyan]
+• https://iptv-org.github.io/iptv/categories/entertainment.m3u
+• https://iptv-org.github.io/iptv/categories/sports.m3u
+• https://iptv-org.github.io/iptv/categories/news.m3u
+
+[bold yellow]💡 Pro Tip:[/bold yellow] Use range selection (e.g., "1-5,10,15-20") in group export for quick bulk operations!
+"""
+_SIMPLE_HELP_TEXT = "\n".join([
+    f"{Fore.CYAN}{Style.BRIGHT}🎯 Enhanced IPTV Manager - Complete Guide{Style.RESET_ALL}",
+    "",
+    f"{Fore.GREEN}🚀 Core Features:{Style.RESET_ALL}",
+    "• Smart Loading: Load from URLs, history, or multiple sources",
+    "• Advanced Analysis: Group stats, TVG tags, series detection",
+    "• Smart Exporting: Filter by groups with multi-select",
+    "• Playlist Management: Merge and manage multiple playlists",
+    "",
+    f"{Fore.YELLOW}💾 Export Features (Option 7):{Style.RESET_ALL}",
+    "• Multi-Column Group Display: Organized group viewing",
+    "• Flexible Selection: Use numbers, ranges (1-5), or toggle",
+    "• Smart Filtering: Include or exclude selected groups",
+    "• Export Summary: Preview before saving",
+    "",
+    f"{Fore.CYAN}🎮 Quick Start:{Style.RESET_ALL}",
+    "1. Load a playlist (option 1 or 2)",
+    "2. Analyze it (options 4-6)",
+    "3. Export filtered content (option 7)",
+    "4. Manage multiple sources (options 8-9)",
+    "",
+    f"{Fore.BLUE}🔗 Sample URLs:{Style.RESET_ALL}",
+    "https://iptv-org.github.io/iptv/categories/entertainment.m3u",
+    "https://iptv-org.github.io/iptv/categories/sports.m3u",
+    "https://iptv-org.github.io/iptv/categories/news.m3u",
+    "",
+    f"{Fore.YELLOW}💡 Pro Tip: Use range selection (e.g., '1-5,10,15-20') in group export!{Style.RESET_ALL}",
+    "",
+]) + "\n"
+
+# From this many rows on, the Rich group analysis is printed as plain
+# preformatted text rather than as a Table
+_GROUP_TABLE_MAX_ROWS = 50
+
+# Rows per column of the Rich group selection
+_GROUP_SELECTION_ROWS = 15
+
+# Options listed under the Rich group selection
+_GROUP_SELECTION_OPTIONS = "\n".join([
+    "",
+    "[bold cyan]Selection Options:[/bold cyan]",
+    "[white]• Enter group numbers (e.g., 1,3,5-10,15)[/white]",
+    "[white]• 'all' - Select all groups[/white]",
+    "[white]• 'none' - Clear selection[/white]",
+    "[white]• 'done' - Finish selection[/white]"
+])
+# Same options for the plain-text group selection
+_SIMPLE_GROUP_SELECTION_OPTIONS = "\n".join([
+    "",
+    f"{Fore.YELLOW}Selection Options:{Style.RESET_ALL}",
+    f"{Fore.WHITE}• Enter group numbers (e.g., 1,3,5 or 1-5,10){Style.RESET_ALL}",
+    f"{Fore.WHITE}• 'all' - Select all groups{Style.RESET_ALL}",
+    f"{Fore.WHITE}• 'none' - Clear selection{Style.RESET_ALL}",
+    f"{Fore.WHITE}• 'done' - Finish selection{Style.RESET_ALL}"
+])
+
+# Characters that make a search pattern a regular expression rather than a literal
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+# One part of a comma-separated selection: a number or a range like 5-10
+_SELECTION_PART_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+
+@functools.lru_cache(maxsize=512)
+def _urlparse(url: str):
+    """urlparse(), memoized: the same URLs are parsed on every load, history entry and reload."""
+    return urlparse(url)
+
+
+def _preview(text: str, width: int) -> str:
+    """Cut a text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else f"{text[:width]}…"
+
+
+@functools.lru_cache(maxsize=128)
+def _search_regex(pattern: str, case_sensitive: bool) -> re.Pattern:
+    """Compile a search pattern, memoized: the same searches are usually repeated in a session."""
+    return re.compile(pattern, re.RegexFlag(0) if case_sensitive else re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=MAX_HISTORY_ENTRIES)
+def _format_history_date(timestamp: float) -> str:
+    """Format a history timestamp, once per entry rather than once per display."""
+    return time.strftime('%m/%d %H:%M', time.localtime(timestamp))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _confirm(message: str, default: bool = True) -> bool:
+    """Ask a yes/no question on the terminal: anything but an explicit answer means the default."""
+    answer = input(f"{Fore.CYAN}{message} {Style.RESET_ALL}").strip().lower()
+    if default:
+        return answer not in ('n', 'no')
+    return answer in ('y', 'yes')
+
+
+def _parse_indices(selection: str, count: int) -> List[int]:
+    """Turn a selection like "1,3,5-10" into 0-based indices, in input order and without duplicates.
+
+    Numbers outside 1..count are skipped, as are empty parts and reversed
+    ranges like "10-5". A part that is neither a number nor a range raises
+    ValueError.
+    """
+    indices: Dict[int, None] = {}
+    for part in selection.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        match = _SELECTION_PART_RE.fullmatch(part)
+        if match is None:
+            raise ValueError(f"Invalid selection: {part}")
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        for number in range(max(start, 1), min(end, count) + 1):
+            indices[number - 1] = None
+    return list(indices)
+
+
+def _interned(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Share a single string per attribute name and per short attribute value.
+
+    Group titles and tvg-* names repeat across thousands of channels, so
+    interning them saves memory and speeds up comparisons between them.
+    """
+    return {
+        sys.intern(key): sys.intern(value) if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH else value
+        for key, value in attributes.items()
+    }
+
+
+def _interned_channel(entry: List[str]) -> IPTVChannel:
+    """Build the channel of a playlist entry, with its attributes interned right away."""
+    ch = from_playlist_entry(entry)
+    ch.attributes = _interned(ch.attributes)
+    return ch
+
+
+def _intern_attributes(channels: List[IPTVChannel]):
+    """Intern the attributes of channels parsed elsewhere, like by playlist.loadu."""
+    for ch in channels:
+        ch.attributes = _interned(ch.attributes)
+
+
+def _playlist_to_columns(pl: M3UPlaylist) -> Dict[str, Any]:
+    """Flatten a playlist into one list per channel field."""
+    channels = pl.get_channels()
+    return {
+        'attributes': pl.get_attributes(),
+        'names': [ch.name for ch in channels],
+        'durations': [ch.duration for ch in channels],
+        'urls': [ch.url for ch in channels],
+        'attrs': [ch.attributes for ch in channels],
+        'extras': [ch.extras for ch in channels]
+    }
+
+
+def _playlist_from_columns(columns: Dict[str, Any]) -> M3UPlaylist:
+    """Rebuild a playlist from the output of _playlist_to_columns."""
+    pl = M3UPlaylist()
+    pl.add_attributes(columns['attributes'])
+    pl.append_channels([
+        IPTVChannel(url=url, name=name, duration=duration, attributes=_interned(attrs), extras=extras)
+        for name, duration, url, attrs, extras in zip(
+            columns['names'], columns['durations'], columns['urls'], columns['attrs'], columns['extras']
+        )
+    ])
+    return pl
+
 
 class EnhancedIPTVManager:
     """Enhanced IPTV Playlist Manager with advanced features."""
@@ -61,201 +371,520 @@ class EnhancedIPTVManager:
     def __init__(self, data_dir: str = "iptv_data"):
         self.current_playlist = None
         self.loaded_playlists: Dict[str, M3UPlaylist] = {}  # name -> playlist
-        self.console = Console() if RICH_AVAILABLE else None
+        self._analysis_cache: Dict[int, Dict[str, Any]] = {}  # id(playlist) -> analysis
+        # (url, sanitize) -> (source version, playlist), most recent last
+        self._url_playlists: 'OrderedDict[Tuple[str, bool], Tuple[Any, M3UPlaylist]]' = OrderedDict()
+        # Guards url_history, loaded_playlists and _url_playlists during parallel loads
+        self._lock = threading.Lock()
+        self._console = None
+        self._help_panel = None
+        # Static menu panels, built on first display
+        self._header_panel = None
+        self._tips_panel = None
+        self._menu_panels: Dict[Tuple[bool, int, int], Any] = {}  # menu state -> menu panel
         self.data_dir = Path(data_dir)
         self.history_file = self.data_dir / "url_history.json"
-        self.playlists_file = self.data_dir / "saved_playlists.pkl"
+        self.playlists_file = self.data_dir / "saved_playlists.json"
+        # Pickle store of the previous versions, converted on first start
+        self.legacy_playlists_file = self.data_dir / "saved_playlists.pkl"
+        # Downloaded playlists, revalidated with their ETag / Last-Modified headers
+        self.cache_dir = self.data_dir / "playlist_cache"
         
         # Initialize data directory
         self.data_dir.mkdir(exist_ok=True)
         self.url_history = self._load_url_history()
+        self._history_dirty = False
         self.saved_playlists = self._load_saved_playlists()
 
-    def _load_url_history(self) -> List[Dict[str, Any]]:
-        """Load URL history from file."""
+    @property
+    def console(self):
+        """The Rich console, created on first use (None when Rich is not installed)."""
+        if self._console is None and RICH_AVAILABLE:
+            self._console = _rich().Console()
+        return self._console
+
+    def _load_url_history(self) -> 'OrderedDict[str, Dict[str, Any]]':
+        """Load URL history from file, most recent entry first, keyed by URL."""
         try:
             if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                entries = _json_loads(self.history_file.read_bytes())
+                return OrderedDict((entry['url'], entry) for entry in entries)
         except Exception as e:
             self._print_error(f"Failed to load URL history: {e}")
-        return []
+        return OrderedDict()
     
     def _save_url_history(self):
-        """Save URL history to file."""
+        """Save URL history to file, atomically replacing the previous one."""
+        tmp_file = self.history_file.with_suffix('.tmp')
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.url_history, f, indent=2)
+            tmp_file.write_bytes(_json_dumps(list(self.url_history.values())))
+            os.replace(tmp_file, self.history_file)
         except Exception as e:
             self._print_error(f"Failed to save URL history: {e}")
     
-    def _load_saved_playlists(self) -> Dict[str, Any]:
+    def _flush_history(self):
+        """Save URL history to file if it changed since the last save."""
+        # Under the lock, so that no worker changes the history while it is saved
+        with self._lock:
+            if self._history_dirty:
+                self._history_dirty = False
+                self._save_url_history()
+    
+    def _load_saved_playlists(self) -> Dict[str, M3UPlaylist]:
         """Load saved playlists from file."""
         try:
             if self.playlists_file.exists():
-                with open(self.playlists_file, 'rb') as f:
-                    return pickle.load(f)
+                payload = _json_loads(self.playlists_file.read_bytes())
+                return {name: _playlist_from_columns(columns) for name, columns in payload.items()}
+            if self.legacy_playlists_file.exists():
+                return self._migrate_legacy_playlists()
         except Exception as e:
             self._print_error(f"Failed to load saved playlists: {e}")
         return {}
     
+    def _migrate_legacy_playlists(self) -> Dict[str, M3UPlaylist]:
+        """Convert the pickle store written by previous versions to JSON.
+
+        This is the only place where pickle is still read, and only once: the
+        JSON file takes precedence as soon as it exists.
+        """
+        import pickle
+        with open(self.legacy_playlists_file, 'rb') as f:
+            self.saved_playlists = pickle.load(f)
+        self._save_saved_playlists()
+        self._print_info(f"Converted {self.legacy_playlists_file.name} to {self.playlists_file.name}")
+        return self.saved_playlists
+    
     def _save_saved_playlists(self):
         """Save playlists to file."""
         try:
-            with open(self.playlists_file, 'wb') as f:
-                pickle.dump(self.saved_playlists, f)
+            payload = {name: _playlist_to_columns(pl) for name, pl in self.saved_playlists.items()}
+            self.playlists_file.write_bytes(_json_dumps(payload))
         except Exception as e:
             self._print_error(f"Failed to save playlists: {e}")
     
     def add_to_history(self, url: str, success: bool, channel_count: int = 0):
-        """Add URL to history."""
+        """Add URL to history (saved to file by _flush_history)."""
         history_entry = {
             'url': url,
             'timestamp': time.time(),
             'success': success,
             'channel_count': channel_count,
-            'domain': urlparse(url).netloc
+            'domain': _urlparse(url).netloc
         }
         
-        # Remove existing entry if present
-        self.url_history = [entry for entry in self.url_history if entry['url'] != url]
-        
-        # Add new entry at beginning
-        self.url_history.insert(0, history_entry)
-        
-        # Keep only last 50 entries
-        self.url_history = self.url_history[:50]
-        
-        self._save_url_history()
+        with self._lock:
+            # Replace any existing entry and move it to the beginning
+            self.url_history.pop(url, None)
+            self.url_history[url] = history_entry
+            self.url_history.move_to_end(url, last=False)
+            
+            # Keep only the most recent entries
+            while len(self.url_history) > MAX_HISTORY_ENTRIES:
+                self.url_history.popitem(last=True)
+            self._history_dirty = True
     
     def load_playlist_from_url(self, url: str, sanitize: bool = True, playlist_name: str = None) -> bool:
         """Load playlist from URL with progress indication."""
+        return self._load_playlist(url, sanitize, playlist_name) is not None
+
+    def _load_playlist(self, url: str, sanitize: bool = True, playlist_name: str = None,
+                       batch: bool = False) -> Optional[M3UPlaylist]:
+        """Load playlist from URL, returning it (None if the load failed).
+
+        In batch mode (see load_multiple_urls) no per-URL progress is shown and
+        the current playlist is left alone, for the loads not to race for it.
+        """
+        rich = _rich()
+        reuse_key = (url, sanitize)
+        with self._lock:
+            known = self._url_playlists.get(reuse_key)
         try:
-            if RICH_AVAILABLE:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
+            if batch or (RICH_AVAILABLE and not self._is_remote(url)):
+                # Local playlists load in a blink: skip the progress display
+                # and its refresh thread altogether
+                loaded = self._load_streaming(url, known)
+                version, pl = loaded
+                if sanitize and pl and loaded is not known and M3UPlaylistDoctor.needs_sanitize(pl):
+                    pl = M3UPlaylistDoctor.sanitize(pl)
+            elif RICH_AVAILABLE:
+                # A single progress display for both the download and the sanitization
+                with rich.Progress(
+                    rich.SpinnerColumn(),
+                    rich.TextColumn("[progress.description]{task.description}"),
                     transient=True,
                 ) as progress:
                     task = progress.add_task(f"Loading playlist from {url}", total=None)
-                    pl = playlist.loadu(url)
+                    loaded = self._load_streaming(url, known)
+                    version, pl = loaded
                     progress.update(task, completed=1)
-            else:
-                print(f"{Fore.YELLOW}Loading playlist from: {url}{Style.RESET_ALL}")
-                pl = playlist.loadu(url)
-            
-            # Sanitize if requested
-            if sanitize and pl:
-                if RICH_AVAILABLE:
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        transient=True,
-                    ) as progress:
+                    if sanitize and pl and loaded is not known and M3UPlaylistDoctor.needs_sanitize(pl):
                         task = progress.add_task("Sanitizing playlist...", total=None)
                         pl = M3UPlaylistDoctor.sanitize(pl)
                         progress.update(task, completed=1)
-                else:
+            else:
+                print(f"{Fore.YELLOW}Loading playlist from: {url}{Style.RESET_ALL}")
+                loaded = self._load_streaming(url, known)
+                version, pl = loaded
+                if sanitize and pl and loaded is not known and M3UPlaylistDoctor.needs_sanitize(pl):
                     print(f"{Fore.YELLOW}Sanitizing playlist...{Style.RESET_ALL}")
                     pl = M3UPlaylistDoctor.sanitize(pl)
             
-            # Set as current playlist
-            self.current_playlist = pl
-            
-            # Generate name if not provided
-            if not playlist_name:
-                domain = urlparse(url).netloc
-                timestamp = time.strftime('%Y%m%d_%H%M%S')
-                playlist_name = f"{domain}_{timestamp}"
-            
-            # Store in loaded playlists
-            self.loaded_playlists[playlist_name] = pl
+            with self._lock:
+                # Set as current playlist
+                if not batch:
+                    self.current_playlist = pl
+                
+                # A reused playlist that is still loaded keeps its name: under
+                # a second one, invalidating its analysis for either name
+                # would clear it for both
+                reloaded = loaded is known and any(
+                    loaded_pl is pl for loaded_pl in self.loaded_playlists.values()
+                )
+                
+                # Generate name if not provided, without clobbering a playlist
+                # loaded from the same domain within the same second
+                if not playlist_name and not reloaded:
+                    domain = _urlparse(url).netloc
+                    timestamp = time.strftime('%Y%m%d_%H%M%S')
+                    base_name = f"{domain}_{timestamp}"
+                    playlist_name = base_name
+                    suffix = 2
+                    while playlist_name in self.loaded_playlists:
+                        playlist_name = f"{base_name}_{suffix}"
+                        suffix += 1
+                
+                # Store in loaded playlists
+                if not reloaded:
+                    if playlist_name in self.loaded_playlists:
+                        self._invalidate_analysis(self.loaded_playlists[playlist_name])
+                    self.loaded_playlists[playlist_name] = pl
+                
+                # Remember it for the next load of the same URL
+                if version is not None:
+                    self._url_playlists[reuse_key] = (version, pl)
+                    self._url_playlists.move_to_end(reuse_key)
+                    if len(self._url_playlists) > MAX_REUSED_PLAYLISTS:
+                        self._url_playlists.popitem(last=False)
             
             # Add to history
             self.add_to_history(url, True, pl.length() if pl else 0)
             
-            return True
+            return pl
             
         except URLException as e:
             self._print_error(f"Failed to load URL: {e}")
-            self.add_to_history(url, False)
-            return False
         except MalformedPlaylistException as e:
             self._print_error(f"Malformed playlist: {e}")
-            self.add_to_history(url, False)
-            return False
         except Exception as e:
             self._print_error(f"Unexpected error: {e}")
-            self.add_to_history(url, False)
-            return False
+        self.add_to_history(url, False)
+        return None
     
+    @staticmethod
+    def _is_remote(url: str) -> bool:
+        """Tell whether a playlist URL points to an HTTP(S) server."""
+        return _urlparse(url).scheme in ('http', 'https')
+
+    @staticmethod
+    def _local_path(url: str) -> Optional[str]:
+        """Return the file path behind a file:// URL or a plain path, if any."""
+        parsed = _urlparse(url)
+        if parsed.scheme == 'file':
+            return url2pathname(parsed.path)
+        if Path(url).is_file():
+            return url
+        return None
+
+    def _load_streaming(self, url: str, known: Optional[Tuple[Any, M3UPlaylist]] = None) -> Tuple[Any, M3UPlaylist]:
+        """Download and parse a playlist in a single pass, row by row.
+
+        Rows are parsed as they arrive from the network or the disk, so the
+        whole body is never held in memory. Downloads that come with an ETag
+        or Last-Modified header are cached in cache_dir, and served from there
+        as long as the server answers 304 Not Modified; only the
+        MAX_CACHED_PLAYLISTS most recently used ones are kept. Other non-HTTP URLs
+        are handed over to playlist.loadu.
+
+        The playlist is returned with its version: the ETag and Last-Modified
+        headers, or the file's modification time and size (None if unknown).
+        If known, an earlier (version, playlist) result of the same URL, is
+        still current it is returned as is, without parsing anything.
+        """
+        if not self._is_remote(url):
+            local_path = self._local_path(url)
+            if local_path is None:
+                pl = playlist.loadu(url)
+                _intern_attributes(pl.get_channels())
+                return None, pl
+            with open(local_path, encoding='utf-8', buffering=STREAM_BUFFER_SIZE) as file:
+                stat = os.fstat(file.fileno())
+                version = (stat.st_mtime_ns, stat.st_size)
+                if known is not None and known[0] == version:
+                    return known
+                return version, self._parse_stream(file)
+        cache_file = self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+        cached = self._read_playlist_cache(cache_file)
+        request = urllib.request.Request(url)
+        if cached is not None:
+            # Let the server answer 304 Not Modified if our copy is still current
+            if cached.get('etag'):
+                request.add_header('If-None-Match', cached['etag'])
+            if cached.get('last_modified'):
+                request.add_header('If-Modified-Since', cached['last_modified'])
+        try:
+            response = urllib.request.urlopen(request, timeout=STREAM_TIMEOUT)
+        except HTTPError as e:
+            if e.code == 304 and cached is not None:
+                self._touch_playlist_cache(cache_file)
+                version = (cached.get('etag'), cached.get('last_modified'))
+                if known is not None and known[0] == version:
+                    return known
+                return version, _playlist_from_columns(cached['playlist'])
+            raise URLException(f"Failure while opening {url}.\nError: {e}") from e
+        except (URLError, ValueError) as e:
+            raise URLException(f"Failure while opening {url}.\nError: {e}") from e
+        with response:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            reader = io.TextIOWrapper(
+                io.BufferedReader(response, buffer_size=STREAM_BUFFER_SIZE),
+                encoding='utf-8',
+                errors='replace'
+            )
+            pl = self._parse_stream(reader)
+        if not (etag or last_modified):
+            # Without validators the cached copy can never be revalidated again
+            self._drop_playlist_cache(cache_file)
+            return None, pl
+        self._write_playlist_cache(cache_file, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'playlist': _playlist_to_columns(pl)
+        })
+        return (etag, last_modified), pl
+
+    @staticmethod
+    def _parse_stream(lines: Iterable[str]) -> M3UPlaylist:
+        """Parse M3U rows one at a time, as produced by a file or a response reader.
+
+        Gives the same playlist as playlist.loadl, without first collecting
+        all the rows or spawning its pool of parser processes.
+        """
+        rows = (row.strip() for row in lines)
+        rows = (row for row in rows if row)
+        header = next(rows, None)
+        if header is None or not m3u.is_m3u_header_row(header):
+            raise MalformedPlaylistException(f"Missing or misplaced {m3u.M3U_HEADER_TAG} row")
+        # A header-only playlist carries just the #EXTM3U attributes
+        pl = playlist.loads(header)
+        channels: List[IPTVChannel] = []
+        entry: List[str] = []
+        for row in rows:
+            if m3u.is_extinf_row(row):
+                if entry and m3u.is_extinf_row(entry[-1]):
+                    # adjacent #EXTINF rows: the previous one has no url
+                    channels.append(_interned_channel(entry))
+                    entry = []
+                entry.append(row)
+            elif m3u.is_comment_or_tag_row(row):
+                entry.append(row)
+            else:
+                entry.append(row)
+                channels.append(_interned_channel(entry))
+                entry = []
+        pl.append_channels(channels)
+        return pl
+
+    def _read_playlist_cache(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Read a cached download, if there is a usable one."""
+        try:
+            if cache_file.exists():
+                return _json_loads(cache_file.read_bytes())
+        except Exception as e:
+            self._print_error(f"Failed to read cached playlist: {e}")
+        return None
+
+    def _write_playlist_cache(self, cache_file: Path, entry: Dict[str, Any]):
+        """Cache a download, atomically replacing the previous copy."""
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            tmp_file.write_bytes(_json_dumps(entry))
+            os.replace(tmp_file, cache_file)
+            self._prune_playlist_cache(cache_file)
+        except Exception as e:
+            self._print_error(f"Failed to cache playlist: {e}")
+
+    def _touch_playlist_cache(self, cache_file: Path):
+        """Mark a cached download as just used, for _prune_playlist_cache to keep it."""
+        try:
+            cache_file.touch()
+        except OSError as e:
+            self._print_error(f"Failed to update cached playlist: {e}")
+
+    def _drop_playlist_cache(self, cache_file: Path):
+        """Delete a cached download, if there is one."""
+        try:
+            cache_file.unlink(missing_ok=True)
+        except OSError as e:
+            self._print_error(f"Failed to delete cached playlist: {e}")
+
+    def _prune_playlist_cache(self, keep: Path):
+        """Delete the least recently used downloads beyond MAX_CACHED_PLAYLISTS.
+
+        keep, the download just cached, is never deleted, even when the file
+        times are too coarse to tell it apart from the others.
+        """
+        others = []
+        for cache_file in self.cache_dir.glob('*.json'):
+            if cache_file != keep:
+                try:
+                    others.append((cache_file.stat().st_mtime_ns, cache_file))
+                except FileNotFoundError:
+                    # Pruned by a parallel load in the meantime
+                    pass
+        others.sort(reverse=True)
+        for _, cache_file in others[MAX_CACHED_PLAYLISTS - 1:]:
+            cache_file.unlink(missing_ok=True)
+
+    def _analysis(self, pl: M3UPlaylist) -> Dict[str, Any]:
+        """Return the groups, urls and series of a playlist, computing them only once.
+
+        A single pass over the channels produces the same results as
+        group_by_attribute(), group_by_url() and extract_series(), along
+        with the number of channels carrying each attribute.
+        """
+        cached = self._analysis_cache.get(id(pl))
+        if cached is None or cached['playlist'] is not pl:
+            group_key = IPTVAttr.GROUP_TITLE.value
+            no_group_key = pl.NO_GROUP_KEY
+            no_url_key = pl.NO_URL_KEY
+            groups: Dict[str, List[int]] = {}
+            urls: Dict[str, List[int]] = {}
+            series_channels: Dict[str, List[IPTVChannel]] = {}
+            non_series_channels: List[IPTVChannel] = []
+            attribute_counts: Counter = Counter()
+            for i, ch in enumerate(pl.get_channels()):
+                attribute_counts.update(ch.attributes.keys())
+                groups.setdefault(ch.attributes.get(group_key) or no_group_key, []).append(i)
+                urls.setdefault(ch.url or no_url_key, []).append(i)
+                # One pattern lookup both tells episodes apart and strips their number
+                pattern = find_episode_pattern(ch.name)
+                if pattern is not None:
+                    series_channels.setdefault(pattern.sub("", ch.name).strip().lower(), []).append(ch)
+                else:
+                    non_series_channels.append(ch)
+            cached = {
+                'playlist': pl,
+                'groups': groups,
+                'urls': urls,
+                'attribute_counts': attribute_counts,
+                'series': {
+                    name: self._new_playlist(pl.get_attributes(), channels)
+                    for name, channels in series_channels.items()
+                },
+                'non_series': self._new_playlist(pl.get_attributes(), non_series_channels)
+            }
+            self._analysis_cache[id(pl)] = cached
+        return cached
+
+    @staticmethod
+    def _new_playlist(attributes: Dict[str, str], channels: List[IPTVChannel]) -> M3UPlaylist:
+        """Build a playlist with the given header attributes and channels."""
+        new_pl = M3UPlaylist()
+        new_pl.add_attributes(attributes)
+        new_pl.append_channels(channels)
+        return new_pl
+
+    def _invalidate_analysis(self, pl: M3UPlaylist):
+        """Drop the cached analysis of a playlist."""
+        self._analysis_cache.pop(id(pl), None)
+
     def load_multiple_urls(self, urls: List[str], sanitize: bool = True):
-        """Load multiple playlists from URLs."""
+        """Load multiple playlists from URLs, downloading them in parallel."""
+        rich = _rich()
         success_count = 0
+        # Download each URL once, even if it is listed several times
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
         
-        if RICH_AVAILABLE:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                transient=False,
-            ) as progress:
-                task = progress.add_task("Loading multiple playlists...", total=len(urls))
-                
-                for url in urls:
-                    progress.update(task, description=f"Loading {url[:50]}...")
-                    if self.load_playlist_from_url(url, sanitize):
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_LOADS, len(urls))) as executor:
+            futures = {
+                executor.submit(self._load_playlist, url, sanitize, batch=True): url
+                for url in urls
+            }
+            if RICH_AVAILABLE:
+                with rich.Progress(
+                    rich.SpinnerColumn(),
+                    rich.TextColumn("[progress.description]{task.description}"),
+                    rich.BarColumn(),
+                    rich.TaskProgressColumn(),
+                    transient=False,
+                ) as progress:
+                    task = progress.add_task("Loading multiple playlists...", total=len(urls))
+                    
+                    for future in as_completed(futures):
+                        progress.update(task, description=f"Loaded {futures[future][:50]}")
+                        if future.result() is not None:
+                            success_count += 1
+                        progress.update(task, advance=1)
+            else:
+                for i, future in enumerate(as_completed(futures)):
+                    print(f"{Fore.CYAN}[{i+1}/{len(urls)}] Loaded: {futures[future]}{Style.RESET_ALL}")
+                    if future.result() is not None:
                         success_count += 1
-                    progress.update(task, advance=1)
-        else:
-            for i, url in enumerate(urls):
-                print(f"{Fore.CYAN}[{i+1}/{len(urls)}] Loading: {url}{Style.RESET_ALL}")
-                if self.load_playlist_from_url(url, sanitize):
-                    success_count += 1
         
+        # The last URL loaded, in input order, becomes the current playlist,
+        # whichever download finished last
+        for future in reversed(list(futures)):
+            if future.result() is not None:
+                self.current_playlist = future.result()
+                break
+        
+        self._flush_history()
         self._print_success(f"Successfully loaded {success_count}/{len(urls)} playlists")
     
     def load_from_history(self):
         """Load playlist from history."""
+        rich = _rich()
         if not self.url_history:
             self._print_warning("No URL history available!")
             return
         
+        entries = list(self.url_history.values())
+        
         if RICH_AVAILABLE:
-            history_table = Table(title="URL History", box=box.ROUNDED)
+            history_table = rich.Table(title="URL History", box=rich.box.ROUNDED)
             history_table.add_column("#", style="white", width=4)
             history_table.add_column("URL", style="cyan")
             history_table.add_column("Channels", style="green", width=10)
             history_table.add_column("Status", style="yellow", width=8)
             history_table.add_column("Date", style="white", width=12)
             
-            for i, entry in enumerate(self.url_history[:20]):
+            for i, entry in enumerate(entries[:20]):
                 status = "✓" if entry['success'] else "✗"
                 status_color = "green" if entry['success'] else "red"
-                date = time.strftime('%m/%d %H:%M', time.localtime(entry['timestamp']))
-                url_preview = entry['url'][:60] + "..." if len(entry['url']) > 60 else entry['url']
-                
+                date = _format_history_date(entry['timestamp'])
                 history_table.add_row(
                     str(i + 1),
-                    url_preview,
+                    _preview(entry['url'], 60),
                     str(entry.get('channel_count', 0)),
                     f"[{status_color}]{status}[/{status_color}]",
                     date
                 )
             
-            self.console.print(Panel(history_table, title="📜 URL History", title_align="left"))
+            self.console.print(rich.Panel(history_table, title="📜 URL History", title_align="left"))
             
             try:
-                choice = IntPrompt.ask(
-                    "Enter history number to load (0 to cancel)",
-                    choices=[str(i) for i in range(0, min(21, len(self.url_history) + 1))],
-                    default=0
-                )
+                choice = self._ask_number("Enter history number to load (0 to cancel)",
+                                          0, min(len(entries), 20), default=0)
                 
-                if choice > 0 and choice <= len(self.url_history):
-                    selected_url = self.url_history[choice - 1]['url']
-                    sanitize = Confirm.ask("Sanitize playlist?")
+                if choice > 0:
+                    selected_url = entries[choice - 1]['url']
+                    sanitize = rich.Confirm.ask("Sanitize playlist?")
                     self.load_playlist_from_url(selected_url, sanitize)
                     
             except Exception:
@@ -263,157 +892,174 @@ class EnhancedIPTVManager:
                 
         else:
             print(f"{Fore.CYAN}{Style.BRIGHT}📜 URL History:{Style.RESET_ALL}")
-            for i, entry in enumerate(self.url_history[:10]):
+            for i, entry in enumerate(entries[:10]):
                 status = "✓" if entry['success'] else "✗"
-                date = time.strftime('%m/%d %H:%M', time.localtime(entry['timestamp']))
+                date = _format_history_date(entry['timestamp'])
                 print(f"{Fore.WHITE}{i+1:2d}. {Fore.CYAN}{entry['url']} {Fore.GREEN}[{entry.get('channel_count', 0)}] {Fore.YELLOW}[{status}] {Fore.WHITE}{date}{Style.RESET_ALL}")
             
             try:
                 choice = input(f"{Fore.CYAN}Enter history number to load (0 to cancel): {Style.RESET_ALL}").strip()
                 if choice.isdigit():
                     choice_num = int(choice)
-                    if 0 < choice_num <= len(self.url_history):
-                        selected_url = self.url_history[choice_num - 1]['url']
-                        sanitize = input(f"{Fore.CYAN}Sanitize playlist? (y/n): {Style.RESET_ALL}").strip().lower() != 'n'
+                    if 0 < choice_num <= len(entries):
+                        selected_url = entries[choice_num - 1]['url']
+                        sanitize = _confirm("Sanitize playlist? (y/n):")
                         self.load_playlist_from_url(selected_url, sanitize)
             except Exception:
                 self._print_info("Selection cancelled")
 
     def display_playlist_overview(self):
         """Display comprehensive playlist overview."""
+        rich = _rich()
         if not self.current_playlist:
             self._print_warning("No playlist loaded!")
             return
         
         pl = self.current_playlist
         total_channels = pl.length()
+        analysis = self._analysis(pl)
         
         if RICH_AVAILABLE:
             # Create overview panel
-            overview_table = Table(title="Playlist Overview", box=box.ROUNDED)
+            overview_table = rich.Table(title="Playlist Overview", box=rich.box.ROUNDED)
             overview_table.add_column("Metric", style="cyan")
             overview_table.add_column("Value", style="white")
             
             overview_table.add_row("Total Channels", f"{total_channels:,}")
             
             # Group analysis
-            groups = pl.group_by_attribute()
+            groups = analysis['groups']
             overview_table.add_row("Unique Groups", f"{len(groups):,}")
             
             # URL analysis
-            url_groups = pl.group_by_url()
+            url_groups = analysis['urls']
             overview_table.add_row("Unique URLs", f"{len(url_groups):,}")
             
             # Series detection
-            series_map, non_series = extract_series(pl)
+            series_map = analysis['series']
             overview_table.add_row("Detected Series", f"{len(series_map):,}")
             
             # Attributes
             playlist_attrs = pl.get_attributes()
             overview_table.add_row("Playlist Attributes", f"{len(playlist_attrs):,}")
             
-            self.console.print(Panel(overview_table, title="📊 Overview", title_align="left"))
+            self.console.print(rich.Panel(overview_table, title="📊 Overview", title_align="left"))
             
         else:
-            print(f"{Fore.CYAN}{Style.BRIGHT}📊 Playlist Overview:{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}Total Channels: {Fore.YELLOW}{total_channels:,}{Style.RESET_ALL}")
-            
-            groups = pl.group_by_attribute()
-            print(f"{Fore.WHITE}Unique Groups: {Fore.YELLOW}{len(groups):,}{Style.RESET_ALL}")
-            
-            url_groups = pl.group_by_url()
-            print(f"{Fore.WHITE}Unique URLs: {Fore.YELLOW}{len(url_groups):,}{Style.RESET_ALL}")
-            
-            series_map, non_series = extract_series(pl)
-            print(f"{Fore.WHITE}Detected Series: {Fore.YELLOW}{len(series_map):,}{Style.RESET_ALL}")
-            
-            playlist_attrs = pl.get_attributes()
-            print(f"{Fore.WHITE}Playlist Attributes: {Fore.YELLOW}{len(playlist_attrs):,}{Style.RESET_ALL}")
-            print()
+            metrics = (
+                ("Total Channels", total_channels),
+                ("Unique Groups", len(analysis['groups'])),
+                ("Unique URLs", len(analysis['urls'])),
+                ("Detected Series", len(analysis['series'])),
+                ("Playlist Attributes", len(pl.get_attributes()))
+            )
+            lines = [f"{Fore.CYAN}{Style.BRIGHT}📊 Playlist Overview:{Style.RESET_ALL}"]
+            lines.extend(_METRIC_ROW_FMT % (name, f"{value:,}") for name, value in metrics)
+            sys.stdout.write("\n".join(lines) + "\n\n")
 
     def display_group_analysis(self, top_n: int = 10):
         """Display group analysis with top groups."""
+        rich = _rich()
         if not self.current_playlist:
             return
         
-        groups = self.current_playlist.group_by_attribute()
-        
-        # Sort groups by channel count
-        sorted_groups = sorted(groups.items(), key=lambda x: len(x[1]), reverse=True)
+        pl = self.current_playlist
+        analysis = self._analysis(pl)
+        total_channels = pl.length() or 1
+        no_group_key = pl.NO_GROUP_KEY
+        
+        # Rank the groups by channel count once per playlist, then compute
+        # only the rows shown
+        group_counts = analysis.get('group_counts')
+        if group_counts is None:
+            group_counts = sorted(
+                ((group_name, len(channel_indices)) for group_name, channel_indices in analysis['groups'].items()),
+                key=itemgetter(1), reverse=True
+            )
+            analysis['group_counts'] = group_counts
+        rows = [
+            (
+                i + 1,
+                group_name if group_name != no_group_key else NO_GROUP_LABEL,
+                count,
+                count * 100 / total_channels
+            )
+            for i, (group_name, count) in enumerate(group_counts[:top_n])
+        ]
         
-        if RICH_AVAILABLE:
-            group_table = Table(title=f"Top {top_n} Groups", box=box.ROUNDED)
+        if RICH_AVAILABLE and top_n >= _GROUP_TABLE_MAX_ROWS:
+            # A single Text renders in a fraction of the time of a large Table
+            lines = [f"{'Rank':>4}  {'Group Name':<30}  {'Channels':>8}  {'Share':>6}"]
+            lines.extend(
+                f"{rank:>4}  {display_name:<30}  {count:>8,}  {percentage:>5.1f}%"
+                for rank, display_name, count, percentage in rows
+            )
+            self.console.print(rich.Panel(rich.Text("\n".join(lines)), title=f"📁 Group Analysis - Top {top_n} Groups",
+                                          title_align="left"))
+            
+        elif RICH_AVAILABLE:
+            group_table = rich.Table(title=f"Top {top_n} Groups", box=rich.box.ROUNDED)
             group_table.add_column("Rank", style="white")
             group_table.add_column("Group Name", style="cyan")
             group_table.add_column("Channel Count", style="green", justify="right")
             group_table.add_column("Percentage", style="yellow", justify="right")
             
-            total_channels = self.current_playlist.length()
-            
-            for i, (group_name, channel_indices) in enumerate(sorted_groups[:top_n]):
-                count = len(channel_indices)
-                percentage = (count / total_channels) * 100
-                
-                # Handle no-group case
-                display_name = group_name if group_name != self.current_playlist.NO_GROUP_KEY else "[No Group]"
-                
-                group_table.add_row(
-                    str(i + 1),
-                    display_name,
-                    f"{count:,}",
-                    f"{percentage:.1f}%"
-                )
+            for rank, display_name, count, percentage in rows:
+                group_table.add_row(str(rank), display_name, f"{count:,}", f"{percentage:.1f}%")
             
-            self.console.print(Panel(group_table, title="📁 Group Analysis", title_align="left"))
+            self.console.print(rich.Panel(group_table, title="📁 Group Analysis", title_align="left"))
             
         else:
-            print(f"{Fore.CYAN}{Style.BRIGHT}📁 Top {top_n} Groups:{Style.RESET_ALL}")
-            total_channels = self.current_playlist.length()
-            
-            for i, (group_name, channel_indices) in enumerate(sorted_groups[:top_n]):
-                count = len(channel_indices)
-                percentage = (count / total_channels) * 100
-                
-                display_name = group_name if group_name != self.current_playlist.NO_GROUP_KEY else "[No Group]"
-                
-                print(f"{Fore.WHITE}{i+1:2d}. {Fore.CYAN}{display_name:<30} {Fore.GREEN}{count:>6,} {Fore.YELLOW}{percentage:>5.1f}%{Style.RESET_ALL}")
-            print()
+            lines = [f"{Fore.CYAN}{Style.BRIGHT}📁 Top {top_n} Groups:{Style.RESET_ALL}"]
+            lines.extend(
+                f"{Fore.WHITE}{rank:2d}. {Fore.CYAN}{display_name:<30} {Fore.GREEN}{count:>6,} {Fore.YELLOW}{percentage:>5.1f}%{Style.RESET_ALL}"
+                for rank, display_name, count, percentage in rows
+            )
+            sys.stdout.write("\n".join(lines) + "\n\n")
 
     def display_series_analysis(self):
         """Display series/episode analysis."""
+        rich = _rich()
         if not self.current_playlist:
             return
         
-        series_map, non_series = extract_series(self.current_playlist, exclude_single=True)
+        # Same as extract_series(..., exclude_single=True), but from the cached analysis
+        series_map = {
+            name: series_pl
+            for name, series_pl in self._analysis(self.current_playlist)['series'].items()
+            if series_pl.length() > 1
+        }
+        
+        # (name, episode count, sample episode name) for the first 15 series
+        rows = []
+        for series_name, series_playlist in list(series_map.items())[:15]:
+            episode_count = series_playlist.length()
+            sample_name = series_playlist.get_channel(0).name if episode_count > 0 else "N/A"
+            rows.append((series_name, episode_count, sample_name))
         
         if RICH_AVAILABLE:
             if series_map:
-                series_table = Table(title="Detected TV Series", box=box.ROUNDED)
+                series_table = rich.Table(title="Detected TV Series", box=rich.box.ROUNDED)
                 series_table.add_column("Series Name", style="cyan")
                 series_table.add_column("Episodes", style="green", justify="right")
                 series_table.add_column("Sample Episode", style="white")
                 
-                for series_name, series_playlist in list(series_map.items())[:15]:
-                    episode_count = series_playlist.length()
-                    sample_channel = series_playlist.get_channel(0) if episode_count > 0 else None
-                    sample_name = sample_channel.name if sample_channel else "N/A"
-                    
+                for series_name, episode_count, sample_name in rows:
                     series_table.add_row(
                         series_name,
                         f"{episode_count:,}",
-                        sample_name[:50] + "..." if len(sample_name) > 50 else sample_name
+                        _preview(sample_name, 50)
                     )
                 
-                self.console.print(Panel(series_table, title="🎭 Series Detection", title_align="left"))
+                self.console.print(rich.Panel(series_table, title="🎭 Series Detection", title_align="left"))
             else:
-                self.console.print(Panel("No series detected in this playlist", 
+                self.console.print(rich.Panel("No series detected in this playlist", 
                                        title="🎭 Series Detection", title_align="left"))
                 
         else:
             print(f"{Fore.CYAN}{Style.BRIGHT}🎭 Series Detection:{Style.RESET_ALL}")
             if series_map:
-                for series_name, series_playlist in list(series_map.items())[:10]:
-                    episode_count = series_playlist.length()
+                for series_name, episode_count, _ in rows[:10]:
                     print(f"{Fore.CYAN}📺 {series_name}: {Fore.GREEN}{episode_count} episodes{Style.RESET_ALL}")
             else:
                 print(f"{Fore.YELLOW}No series detected in this playlist{Style.RESET_ALL}")
@@ -421,6 +1067,7 @@ class EnhancedIPTVManager:
 
     def search_channels(self, pattern: str, search_fields: List[str] = None, case_sensitive: bool = False):
         """Search channels with pattern and display results."""
+        rich = _rich()
         if not self.current_playlist:
             self._print_warning("No playlist loaded!")
             return
@@ -428,44 +1075,113 @@ class EnhancedIPTVManager:
         if search_fields is None:
             search_fields = ["name", "attributes.group-title"]
         
-        results = self.current_playlist.search(pattern, search_fields, case_sensitive)
+        try:
+            if self._is_indexed_search(search_fields):
+                results = self._search_indexed(self.current_playlist, pattern, search_fields, case_sensitive)
+            else:
+                results = self.current_playlist.search(pattern, search_fields, case_sensitive)
+        except re.error as e:
+            self._print_error(f"Invalid search pattern: {e}")
+            return
+        
+        group_key = IPTVAttr.GROUP_TITLE.value
         
         if RICH_AVAILABLE:
             if results:
-                search_table = Table(title=f"Search Results for '{pattern}'", box=box.ROUNDED)
+                # Cells are given as Text, so that names, groups and the pattern
+                # itself are not parsed as markup
+                search_table = rich.Table(title=rich.Text(f"Search Results for '{pattern}'"), box=rich.box.ROUNDED)
                 search_table.add_column("#", style="white")
                 search_table.add_column("Channel Name", style="cyan")
                 search_table.add_column("Group", style="green")
                 search_table.add_column("URL", style="yellow")
                 
-                for i, channel in enumerate(results[:20]):
-                    group = channel.attributes.get('group-title', 'N/A')
-                    url_preview = channel.url[:50] + "..." if len(channel.url) > 50 else channel.url
-                    
+                for i, channel in enumerate(results[:20], 1):
                     search_table.add_row(
-                        str(i + 1),
-                        channel.name,
-                        group,
-                        url_preview
+                        rich.Text(str(i)),
+                        rich.Text(channel.name),
+                        rich.Text(channel.attributes.get(group_key, 'N/A')),
+                        rich.Text(_preview(channel.url, 50))
                     )
                 
-                self.console.print(Panel(search_table, title="🔍 Search Results", title_align="left"))
+                self.console.print(rich.Panel(search_table, title="🔍 Search Results", title_align="left"))
                 self.console.print(f"[dim]Found {len(results):,} matching channels[/dim]")
             else:
-                self.console.print(Panel("No channels found matching your search criteria", 
+                self.console.print(rich.Panel("No channels found matching your search criteria", 
                                        title="🔍 Search Results", title_align="left"))
                 
         else:
             print(f"{Fore.CYAN}{Style.BRIGHT}🔍 Search Results for '{pattern}':{Style.RESET_ALL}")
             if results:
-                for i, channel in enumerate(results[:15]):
-                    group = channel.attributes.get('group-title', 'N/A')
-                    print(f"{Fore.WHITE}{i+1:2d}. {Fore.CYAN}{channel.name} {Fore.GREEN}[{group}]{Style.RESET_ALL}")
-                print(f"{Fore.DIM}Found {len(results):,} matching channels{Style.RESET_ALL}")
+                sys.stdout.write("".join(
+                    f"{Fore.WHITE}{i:2d}. {Fore.CYAN}{channel.name} {Fore.GREEN}"
+                    f"[{channel.attributes.get(group_key, 'N/A')}]{Style.RESET_ALL}\n"
+                    for i, channel in enumerate(results[:15], 1)
+                ))
+                print(f"{Style.DIM}Found {len(results):,} matching channels{Style.RESET_ALL}")
             else:
                 print(f"{Fore.YELLOW}No channels found matching your search criteria{Style.RESET_ALL}")
             print()
 
+    @staticmethod
+    def _is_indexed_search(search_fields: List[str]) -> bool:
+        """Tell whether a search can be answered by _search_indexed."""
+        return all(field == 'name' or field.startswith('attributes.') for field in search_fields)
+
+    @staticmethod
+    def _search_value(ch: IPTVChannel, field: str) -> Optional[str]:
+        """Return the value of a "name" or "attributes.<key>" search field."""
+        if field == 'name':
+            return ch.name
+        return ch.attributes.get(field[len('attributes.'):])
+
+    def _search_index(self, pl: M3UPlaylist, field: str, case_sensitive: bool) -> Dict[str, List[int]]:
+        """Map every value of a search field to the indices of its channels, computing it only once.
+
+        Without case sensitivity the values are case-folded.
+        """
+        indices = self._analysis(pl).setdefault('search_indices', {})
+        index = indices.get((field, case_sensitive))
+        if index is None:
+            index = {}
+            for i, ch in enumerate(pl.get_channels()):
+                value = self._search_value(ch, field)
+                if value is not None:
+                    index.setdefault(value if case_sensitive else value.casefold(), []).append(i)
+            indices[(field, case_sensitive)] = index
+        return index
+
+    def _search_indexed(self, pl: M3UPlaylist, pattern: str, search_fields: List[str],
+                        case_sensitive: bool) -> List[IPTVChannel]:
+        """Same as pl.search() on "name" and "attributes.<key>" fields, through the search indices.
+
+        A pattern without regex metacharacters only matches the values equal
+        to it: one lookup per field finds them. Any other pattern is matched
+        once per distinct value (e.g. a few dozen group titles) rather than
+        once per channel.
+        """
+        channels = pl.get_channels()
+        matches = set()
+        if not _REGEX_METACHARACTERS.isdisjoint(pattern):
+            regex = _search_regex(pattern, case_sensitive)
+            for field in search_fields:
+                for value, indices in self._search_index(pl, field, True).items():
+                    if regex.fullmatch(value):
+                        matches.update(indices)
+            return [channels[i] for i in sorted(matches)]
+        key = pattern if case_sensitive else pattern.casefold()
+        for field in search_fields:
+            matches.update(self._search_index(pl, field, case_sensitive).get(key, ()))
+        if not case_sensitive:
+            # case folding is looser than re.IGNORECASE (e.g. "ss" and "ß"),
+            # so double check the few candidates with the regex itself
+            regex = _search_regex(pattern, False)
+            matches = {
+                i for i in matches
+                if any(regex.fullmatch(self._search_value(channels[i], field) or '') for field in search_fields)
+            }
+        return [channels[i] for i in sorted(matches)]
+
     def export_playlist(self, format_type: str = "json"):
         """Export playlist in different formats."""
         if not self.current_playlist:
@@ -473,27 +1189,30 @@ class EnhancedIPTVManager:
             return
         
         try:
-            if format_type.lower() == "json":
-                output = self.current_playlist.to_json_playlist()
-                filename = f"playlist_export_{int(time.time())}.json"
-            elif format_type.lower() == "m3u":
-                output = self.current_playlist.to_m3u_plus_playlist()
-                filename = f"playlist_export_{int(time.time())}.m3u"
-            elif format_type.lower() == "m3u8":
-                output = self.current_playlist.to_m3u8_playlist()
-                filename = f"playlist_export_{int(time.time())}.m3u8"
-            else:
+            format_type = format_type.lower()
+            if format_type not in ("json", "m3u", "m3u8"):
                 self._print_error("Unsupported format. Use: json, m3u, or m3u8")
                 return
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(output)
+            filename = f"playlist_export_{int(time.time())}.{format_type}"
+            self._write_playlist(self.current_playlist, format_type, filename)
             
             self._print_success(f"Playlist exported successfully to: {filename}")
             
         except Exception as e:
             self._print_error(f"Export failed: {e}")
 
+    @staticmethod
+    def _write_playlist(pl: M3UPlaylist, format_type: str, filename: str):
+        """Stream a playlist to disk in the given format (json, m3u or m3u8)."""
+        with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            if format_type == "json":
+                pl.write_json_playlist(f)
+            elif format_type == "m3u":
+                pl.write_m3u_plus_playlist(f)
+            else:
+                pl.write_m3u8_playlist(f)
+
     def _load_playlist_interactive(self):
         """Interactive playlist loading."""
         url = input(f"{Fore.CYAN}Enter playlist URL: {Style.RESET_ALL}").strip()
@@ -501,8 +1220,7 @@ class EnhancedIPTVManager:
             self._print_warning("URL cannot be empty!")
             return
         
-        sanitize = input(f"{Fore.CYAN}Sanitize playlist? (y/n, default=y): {Style.RESET_ALL}").strip().lower()
-        sanitize = sanitize != 'n'
+        sanitize = _confirm("Sanitize playlist? (y/n, default=y):")
         
         self.load_playlist_from_url(url, sanitize)
         
@@ -511,21 +1229,21 @@ class EnhancedIPTVManager:
     
     def parse_tvg_tags_analysis(self):
         """Analyze and display TVG tag usage across playlist."""
+        rich = _rich()
         if not self.current_playlist:
             self._print_warning("No playlist loaded!")
             return
         
-        tag_stats = {}
-        total_channels = self.current_playlist.length()
-        
-        for channel in self.current_playlist:
-            for attr_name in channel.attributes:
-                if attr_name.startswith('tvg-'):
-                    tag_stats[attr_name] = tag_stats.get(attr_name, 0) + 1
+        pl = self.current_playlist
+        total_channels = pl.length()
+        tag_stats = Counter({
+            name: count for name, count in self._analysis(pl)['attribute_counts'].items()
+            if name.startswith('tvg-')
+        })
         
         if RICH_AVAILABLE:
             if tag_stats:
-                tag_table = Table(title="TVG Tag Analysis", box=box.ROUNDED)
+                tag_table = rich.Table(title="TVG Tag Analysis", box=rich.box.ROUNDED)
                 tag_table.add_column("TVG Tag", style="cyan")
                 tag_table.add_column("Count", style="green", justify="right")
                 tag_table.add_column("Percentage", style="yellow", justify="right")
@@ -544,7 +1262,7 @@ class EnhancedIPTVManager:
                     'tvg-rec': 'Recording capability'
                 }
                 
-                for tag, count in sorted(tag_stats.items(), key=lambda x: x[1], reverse=True):
+                for tag, count in tag_stats.most_common():
                     percentage = (count / total_channels) * 100
                     description = tag_descriptions.get(tag, 'Unknown tag')
                     
@@ -555,15 +1273,15 @@ class EnhancedIPTVManager:
                         description
                     )
                 
-                self.console.print(Panel(tag_table, title="🏷️ TVG Tag Analysis", title_align="left"))
+                self.console.print(rich.Panel(tag_table, title="🏷️ TVG Tag Analysis", title_align="left"))
             else:
-                self.console.print(Panel("No TVG tags found in playlist", 
+                self.console.print(rich.Panel("No TVG tags found in playlist", 
                                        title="🏷️ TVG Tag Analysis", title_align="left"))
                 
         else:
             print(f"{Fore.CYAN}{Style.BRIGHT}🏷️ TVG Tag Analysis:{Style.RESET_ALL}")
             if tag_stats:
-                for tag, count in sorted(tag_stats.items(), key=lambda x: x[1], reverse=True):
+                for tag, count in tag_stats.most_common():
                     percentage = (count / total_channels) * 100
                     print(f"{Fore.CYAN}{tag:<15} {Fore.GREEN}{count:>6,} {Fore.YELLOW}{percentage:>6.1f}%{Style.RESET_ALL}")
             else:
@@ -572,13 +1290,18 @@ class EnhancedIPTVManager:
     
     def export_with_group_filter(self):
         """Enhanced export with interactive group filtering."""
+        rich = _rich()
         if not self.current_playlist:
             self._print_warning("No playlist loaded!")
             return
         
-        # Get all groups
-        groups = self.current_playlist.group_by_attribute()
-        group_names = sorted([name for name in groups.keys() if name != self.current_playlist.NO_GROUP_KEY])
+        # Get all groups, sorting their names only once per playlist
+        analysis = self._analysis(self.current_playlist)
+        groups = analysis['groups']
+        group_names = analysis.get('group_names')
+        if group_names is None:
+            group_names = sorted([name for name in groups.keys() if name != self.current_playlist.NO_GROUP_KEY])
+            analysis['group_names'] = group_names
         
         if not group_names:
             self._print_warning("No groups found in playlist!")
@@ -595,51 +1318,52 @@ class EnhancedIPTVManager:
             return
         
         # Export options
+        total_channels = self.current_playlist.length()
+        filtered_count = sum(len(groups[group]) for group in selected_groups)
         if RICH_AVAILABLE:
-            export_panel = Panel(
+            export_panel = rich.Panel(
                 f"[cyan]Selected Groups:[/cyan] {len(selected_groups)}\n"
-                f"[green]Total Channels:[/green] {self.current_playlist.length():,}\n"
-                f"[yellow]Filtered Channels:[/yellow] {sum(len(groups[group]) for group in selected_groups):,}",
+                f"[green]Total Channels:[/green] {total_channels:,}\n"
+                f"[yellow]Filtered Channels:[/yellow] {filtered_count:,}",
                 title="📦 Export Summary",
                 border_style="green"
             )
             self.console.print(export_panel)
             
-            format_choice = Prompt.ask(
+            format_choice = rich.Prompt.ask(
                 "Export format",
                 choices=["json", "m3u", "m3u8"],
                 default="m3u"
             )
             
-            exclude = Confirm.ask("Exclude selected groups instead of including?", default=False)
+            exclude = rich.Confirm.ask("Exclude selected groups instead of including?", default=False)
             
-            filename_prompt = Prompt.ask(
+            filename_prompt = rich.Prompt.ask(
                 "Filename (leave empty for auto-generated)",
                 default=""
             )
         else:
             print(f"{Fore.GREEN}📦 Export Summary:{Style.RESET_ALL}")
             print(f"{Fore.CYAN}Selected Groups: {Fore.WHITE}{len(selected_groups)}{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}Total Channels: {Fore.WHITE}{self.current_playlist.length():,}{Style.RESET_ALL}")
-            filtered_count = sum(len(groups[group]) for group in selected_groups)
+            print(f"{Fore.GREEN}Total Channels: {Fore.WHITE}{total_channels:,}{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}Filtered Channels: {Fore.WHITE}{filtered_count:,}{Style.RESET_ALL}")
             
             format_choice = input(f"{Fore.CYAN}Export format (json/m3u/m3u8, default=m3u): {Style.RESET_ALL}").strip().lower() or "m3u"
-            exclude = input(f"{Fore.CYAN}Exclude selected groups? (y/n, default=n): {Style.RESET_ALL}").strip().lower() == 'y'
+            exclude = _confirm("Exclude selected groups? (y/n, default=n):", default=False)
             filename_prompt = input(f"{Fore.CYAN}Filename (enter for auto): {Style.RESET_ALL}").strip()
         
-        # Create filtered playlist
-        filtered_pl = M3UPlaylist()
-        filtered_pl.add_attributes(self.current_playlist.get_attributes())
-        
-        channels_exported = 0
-        for channel in self.current_playlist:
-            channel_group = channel.attributes.get('group-title', '')
-            should_include = (channel_group in selected_groups) if not exclude else (channel_group not in selected_groups)
-            
-            if should_include:
-                filtered_pl.append_channel(channel)
-                channels_exported += 1
+        # Create filtered playlist from the group index: keep the groups whose
+        # membership differs from the exclude flag (i.e. selected XOR exclude),
+        # in their original playlist order
+        group_set = frozenset(selected_groups)
+        channels = self.current_playlist.get_channels()
+        kept = [
+            channels[i] for i in sorted(chain.from_iterable(
+                indices for name, indices in groups.items() if (name in group_set) != exclude
+            ))
+        ]
+        filtered_pl = self._new_playlist(self.current_playlist.get_attributes(), kept)
+        channels_exported = len(kept)
         
         # Generate filename
         if filename_prompt:
@@ -653,18 +1377,11 @@ class EnhancedIPTVManager:
             filename = f"iptv_{groups_str}_{group_desc}_{timestamp}.{format_choice}"
         
         try:
-            if format_choice == "json":
-                output = filtered_pl.to_json_playlist()
-            elif format_choice == "m3u":
-                output = filtered_pl.to_m3u_plus_playlist()
-            elif format_choice == "m3u8":
-                output = filtered_pl.to_m3u8_playlist()
-            else:
+            if format_choice not in ("json", "m3u", "m3u8"):
                 self._print_error("Unsupported format")
                 return
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(output)
+            self._write_playlist(filtered_pl, format_choice, filename)
             
             self._print_success(f"✅ Exported {channels_exported} channels to: {filename}")
             
@@ -673,92 +1390,64 @@ class EnhancedIPTVManager:
     
     def _enhanced_group_selection(self, group_names: List[str], groups: Dict[str, List[int]]) -> List[str]:
         """Enhanced group selection with rich interface."""
+        rich = _rich()
         selected_groups = set()
         
+        # Multi-column layout for groups. Only the columns whose selection
+        # changed since the previous frame are rebuilt.
+        items_per_column = _GROUP_SELECTION_ROWS
+        total_columns = (len(group_names) + items_per_column - 1) // items_per_column
+        group_tables = [None] * total_columns
+        dirty_columns = set(range(total_columns))
+        row_cells = self._group_row_cells(group_names, groups)
+        # After 'all' or 'none' every column changed, so the columns are
+        # only shown again when asked for
+        show_groups = True
+        
         while True:
-            # Create multi-column layout for groups
-            group_tables = []
-            items_per_column = 15
-            total_columns = (len(group_names) + items_per_column - 1) // items_per_column
-            
-            for col_idx in range(total_columns):
-                start_idx = col_idx * items_per_column
-                end_idx = min(start_idx + items_per_column, len(group_names))
+            if show_groups:
+                for col_idx in dirty_columns:
+                    group_tables[col_idx] = self._group_column_table(group_names, row_cells, selected_groups, col_idx)
+                dirty_columns.clear()
                 
-                column_table = Table(
-                    title=f"Groups {start_idx+1}-{end_idx}",
-                    box=box.SIMPLE,
-                    show_header=True,
-                    header_style="bold magenta"
+                # Display groups in columns, followed by the selection options,
+                # as a single frame
+                self._buffered_print(
+                    rich.Panel(rich.Columns(group_tables, equal=True, expand=False), title="📋 Available Groups - Multi-Select", title_align="left"),
+                    _GROUP_SELECTION_OPTIONS,
+                    f"[green]Currently selected: {len(selected_groups)} groups[/green]\n"
                 )
-                column_table.add_column("#", style="white", width=4)
-                column_table.add_column("Select", style="cyan", width=8)
-                column_table.add_column("Group Name", style="green")
-                column_table.add_column("Channels", style="yellow", justify="right", width=10)
-                
-                for i in range(start_idx, end_idx):
-                    group_name = group_names[i]
-                    count = len(groups[group_name])
-                    is_selected = "✓" if group_name in selected_groups else " "
-                    selection_status = "[green]✓[/green]" if group_name in selected_groups else "[dim] [/dim]"
-                    
-                    column_table.add_row(
-                        str(i + 1),
-                        selection_status,
-                        group_name,
-                        f"{count:,}"
-                    )
-                
-                group_tables.append(column_table)
-            
-            # Display groups in columns
-            self.console.print(Panel(Columns(group_tables), title="📋 Available Groups - Multi-Select", title_align="left"))
-            
-            # Selection options
-            self.console.print("\n[bold cyan]Selection Options:[/bold cyan]")
-            self.console.print("[white]• Enter group numbers (e.g., 1,3,5-10,15)[/white]")
-            self.console.print("[white]• 'all' - Select all groups[/white]")
-            self.console.print("[white]• 'none' - Clear selection[/white]")
-            self.console.print("[white]• 'done' - Finish selection[/white]")
-            self.console.print(f"[green]Currently selected: {len(selected_groups)} groups[/green]\n")
-            
-            choice = Prompt.ask(
-                "Enter your selection",
-                default="done"
-            ).strip().lower()
+                choice = rich.Prompt.ask("Enter your selection", default="done")
+            else:
+                choice = rich.Prompt.ask(
+                    "Press ENTER to show the groups, or enter your selection",
+                    default="", show_default=False
+                )
+            choice = choice.strip().lower()
             
-            if choice == 'done':
+            if not choice:
+                show_groups = True
+            elif choice == 'done':
                 break
             elif choice == 'all':
                 selected_groups = set(group_names)
+                dirty_columns.update(range(total_columns))
+                show_groups = False
                 self._print_success(f"Selected all {len(group_names)} groups")
             elif choice == 'none':
                 selected_groups.clear()
+                dirty_columns.update(range(total_columns))
+                show_groups = False
                 self._print_info("Selection cleared")
             else:
                 # Parse number ranges (e.g., "1,3,5-10,15")
-                new_selections = set()
                 try:
-                    for part in choice.split(','):
-                        part = part.strip()
-                        if '-' in part:
-                            start, end = part.split('-')
-                            start_idx = int(start.strip()) - 1
-                            end_idx = int(end.strip()) - 1
-                            for idx in range(start_idx, end_idx + 1):
-                                if 0 <= idx < len(group_names):
-                                    new_selections.add(group_names[idx])
-                        else:
-                            idx = int(part.strip()) - 1
-                            if 0 <= idx < len(group_names):
-                                new_selections.add(group_names[idx])
+                    indices = _parse_indices(choice, len(group_names))
                     
                     # Toggle selection for specified groups
-                    for group in new_selections:
-                        if group in selected_groups:
-                            selected_groups.remove(group)
-                        else:
-                            selected_groups.add(group)
+                    selected_groups.symmetric_difference_update(group_names[idx] for idx in indices)
+                    dirty_columns.update(idx // items_per_column for idx in indices)
+                    show_groups = True
                     
                     self._print_success(f"Updated selection: {len(selected_groups)} groups selected")
                     
@@ -767,94 +1456,118 @@ class EnhancedIPTVManager:
         
         return list(selected_groups)
     
+    @staticmethod
+    def _group_row_cells(group_names: List[str], groups: Dict[str, List[int]]) -> List[Tuple[str, str, str]]:
+        """Format the number, name and count cells of every row of the Rich group selection.
+
+        Names are padded to the longest name of their column, so the rows of
+        a column line up.
+        """
+        cells = []
+        for start_idx in range(0, len(group_names), _GROUP_SELECTION_ROWS):
+            column_names = group_names[start_idx:start_idx + _GROUP_SELECTION_ROWS]
+            name_width = max(map(len, column_names))
+            cells.extend(
+                (f"{i:>4} ", f"{name:<{name_width}} ", f"{len(groups[name]):>7,}\n")
+                for i, name in enumerate(column_names, start_idx + 1)
+            )
+        return cells
+    
+    @staticmethod
+    def _group_column_table(group_names: List[str], row_cells: List[Tuple[str, str, str]], selected_groups: Set[str],
+                            col_idx: int):
+        """Build one column of the Rich group selection layout.
+
+        The column is a single Text, which Rich lays out much faster than a
+        Table as it has no column widths to negotiate. The cells come
+        preformatted from _group_row_cells(), only the check marks change.
+        """
+        rich = _rich()
+        start_idx = col_idx * _GROUP_SELECTION_ROWS
+        end_idx = min(start_idx + _GROUP_SELECTION_ROWS, len(group_names))
+        
+        column = rich.Text(f"Groups {start_idx+1}-{end_idx}\n", style="bold magenta")
+        append = column.append
+        for i in range(start_idx, end_idx):
+            number, name, count = row_cells[i]
+            append(number, style="white")
+            if group_names[i] in selected_groups:
+                append("✓ ", style="green")
+            else:
+                append("  ")
+            append(name, style="green")
+            append(count, style="yellow")
+        column.rstrip()
+        return column
+    
     def _simple_group_selection(self, group_names: List[str], groups: Dict[str, List[int]]) -> List[str]:
         """Simple group selection for non-rich interface."""
-        selected_groups = []
+        # Insertion-ordered set: O(1) membership, selection order preserved
+        selected_groups: Dict[str, None] = {}
+        # Everything in a row but the check mark is formatted once
+        row_parts = [
+            (f"{Fore.WHITE}{i+1:3d}. [",
+             f"] {Fore.CYAN}{name:<35} {Fore.GREEN}{len(groups[name]):>5,}{Style.RESET_ALL}")
+            for i, name in enumerate(group_names)
+        ]
         
         while True:
-            print(f"\n{Fore.CYAN}{Style.BRIGHT}📋 Available Groups:{Style.RESET_ALL}")
-            for i, group_name in enumerate(group_names):
-                count = len(groups[group_name])
-                selected = "✓" if group_name in selected_groups else " "
-                print(f"{Fore.WHITE}{i+1:3d}. [{selected}] {Fore.CYAN}{group_name:<35} {Fore.GREEN}{count:>5,}{Style.RESET_ALL}")
-            
-            print(f"\n{Fore.YELLOW}Selection Options:{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}• Enter group numbers (e.g., 1,3,5 or 1-5,10){Style.RESET_ALL}")
-            print(f"{Fore.WHITE}• 'all' - Select all groups{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}• 'none' - Clear selection{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}• 'done' - Finish selection{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}Currently selected: {len(selected_groups)} groups{Style.RESET_ALL}")
+            # The whole frame is written at once
+            lines = [f"\n{Fore.CYAN}{Style.BRIGHT}📋 Available Groups:{Style.RESET_ALL}"]
+            lines.extend(
+                f"{head}{'✓' if group_name in selected_groups else ' '}{tail}"
+                for group_name, (head, tail) in zip(group_names, row_parts)
+            )
+            lines.append(_SIMPLE_GROUP_SELECTION_OPTIONS)
+            lines.append(f"{Fore.GREEN}Currently selected: {len(selected_groups)} groups{Style.RESET_ALL}\n")
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
             
             choice = input(f"\n{Fore.CYAN}Enter your selection: {Style.RESET_ALL}").strip().lower()
             
             if choice == 'done':
                 break
             elif choice == 'all':
-                selected_groups = group_names.copy()
+                selected_groups = dict.fromkeys(group_names)
                 print(f"{Fore.GREEN}Selected all {len(group_names)} groups{Style.RESET_ALL}")
             elif choice == 'none':
                 selected_groups.clear()
                 print(f"{Fore.BLUE}Selection cleared{Style.RESET_ALL}")
             else:
                 # Parse number ranges
-                new_selections = set()
                 try:
-                    for part in choice.split(','):
-                        part = part.strip()
-                        if '-' in part:
-                            start, end = part.split('-')
-                            start_idx = int(start.strip()) - 1
-                            end_idx = int(end.strip()) - 1
-                            for idx in range(start_idx, end_idx + 1):
-                                if 0 <= idx < len(group_names):
-                                    new_selections.add(group_names[idx])
-                        else:
-                            idx = int(part.strip()) - 1
-                            if 0 <= idx < len(group_names):
-                                new_selections.add(group_names[idx])
+                    new_selections = [group_names[idx] for idx in _parse_indices(choice, len(group_names))]
                     
                     # Toggle selection
                     for group in new_selections:
                         if group in selected_groups:
-                            selected_groups.remove(group)
+                            del selected_groups[group]
                         else:
-                            selected_groups.append(group)
+                            selected_groups[group] = None
                     
                     print(f"{Fore.GREEN}Updated selection: {len(selected_groups)} groups selected{Style.RESET_ALL}")
                     
                 except ValueError:
                     print(f"{Fore.RED}Invalid input. Please enter numbers or ranges.{Style.RESET_ALL}")
         
-        return selected_groups
+        return list(selected_groups)
     
     def manage_loaded_playlists(self):
         """Manage multiple loaded playlists."""
+        rich = _rich()
         if not self.loaded_playlists:
             self._print_warning("No playlists loaded!")
             return
         
         if RICH_AVAILABLE:
-            pl_table = Table(title="Loaded Playlists", box=box.ROUNDED)
-            pl_table.add_column("#", style="white", width=4)
-            pl_table.add_column("Name", style="cyan")
-            pl_table.add_column("Channels", style="green", width=10)
-            pl_table.add_column("Groups", style="yellow", width=10)
-            
-            playlist_names = list(self.loaded_playlists.keys())
+            pl_table = self._playlists_table("Loaded Playlists", show_groups=True)
+            playlist_names = tuple(self.loaded_playlists)
             
-            for i, name in enumerate(playlist_names):
-                pl = self.loaded_playlists[name]
-                groups = len(pl.group_by_attribute())
-                pl_table.add_row(str(i + 1), name, f"{pl.length():,}", f"{groups:,}")
-            
-            self.console.print(Panel(pl_table, title="📚 Loaded Playlists", title_align="left"))
+            self.console.print(rich.Panel(pl_table, title="📚 Loaded Playlists", title_align="left"))
             
             try:
-                choice = IntPrompt.ask(
-                    "Select playlist to make current (0 to cancel)",
-                    choices=[str(i) for i in range(0, len(playlist_names) + 1)],
-                    default=0
-                )
+                choice = self._ask_number("Select playlist to make current (0 to cancel)",
+                                          0, len(playlist_names), default=0)
                 
                 if choice > 0 and choice <= len(playlist_names):
                     selected_name = playlist_names[choice - 1]
@@ -862,21 +1575,18 @@ class EnhancedIPTVManager:
                     self._print_success(f"Switched to playlist: {selected_name}")
                     
                 # Additional management options
-                action = Prompt.ask(
+                action = rich.Prompt.ask(
                     "Management action",
                     choices=["switch", "remove", "merge", "cancel"],
                     default="cancel"
                 )
                 
                 if action == "remove":
-                    remove_choice = IntPrompt.ask(
-                        "Enter playlist number to remove",
-                        choices=[str(i) for i in range(1, len(playlist_names) + 1)]
-                    )
+                    remove_choice = self._ask_number("Enter playlist number to remove", 1, len(playlist_names))
                     if remove_choice > 0:
                         removed_name = playlist_names[remove_choice - 1]
                         if removed_name in self.loaded_playlists:
-                            del self.loaded_playlists[removed_name]
+                            self._invalidate_analysis(self.loaded_playlists.pop(removed_name))
                             self._print_success(f"Removed playlist: {removed_name}")
                             
             except Exception:
@@ -884,10 +1594,7 @@ class EnhancedIPTVManager:
                 
         else:
             print(f"{Fore.CYAN}{Style.BRIGHT}📚 Loaded Playlists:{Style.RESET_ALL}")
-            playlist_names = list(self.loaded_playlists.keys())
-            for i, name in enumerate(playlist_names):
-                pl = self.loaded_playlists[name]
-                print(f"{Fore.WHITE}{i+1:2d}. {Fore.CYAN}{name} {Fore.GREEN}[{pl.length():,} channels]{Style.RESET_ALL}")
+            playlist_names = self._print_playlist_rows()
             
             try:
                 choice = input(f"{Fore.CYAN}Select playlist to make current (0 to cancel): {Style.RESET_ALL}").strip()
@@ -900,6 +1607,44 @@ class EnhancedIPTVManager:
             except Exception:
                 self._print_info("Selection cancelled")
     
+    def _playlists_table(self, title: str, show_groups: bool):
+        """Build the Rich table listing the loaded playlists.
+
+        Cells are given as Text, so names and counts are not parsed as markup.
+        """
+        rich = _rich()
+        pl_table = rich.Table(title=title, box=rich.box.ROUNDED)
+        pl_table.add_column("#", style="white", width=4)
+        pl_table.add_column("Name", style="cyan")
+        pl_table.add_column("Channels", style="green", width=10)
+        if show_groups:
+            pl_table.add_column("Groups", style="yellow", width=10)
+        
+        for i, (name, pl) in enumerate(self.loaded_playlists.items(), 1):
+            row = [rich.Text(str(i)), rich.Text(name), rich.Text(f"{pl.length():,}")]
+            if show_groups:
+                row.append(rich.Text(f"{len(self._analysis(pl)['groups']):,}"))
+            pl_table.add_row(*row)
+        return pl_table
+    
+    def _print_playlist_rows(self) -> Tuple[str, ...]:
+        """Print the numbered plain-text list of loaded playlists and return their names in that order."""
+        playlist_names = tuple(self.loaded_playlists)
+        sys.stdout.write("".join(
+            _PLAYLIST_ROW_FMT % (i, name, f"{pl.length():,}") + "\n"
+            for i, (name, pl) in enumerate(self.loaded_playlists.items(), 1)
+        ))
+        return playlist_names
+    
+    def _ask_number(self, prompt: str, low: int, high: int, default: Any = ...) -> int:
+        """Ask for a number between low and high (both included) with Rich, until a valid one is given."""
+        rich = _rich()
+        while True:
+            value = rich.IntPrompt.ask(f"{prompt} [{low}-{high}]", default=default)
+            if low <= value <= high:
+                return value
+            self.console.print(f"[prompt.invalid]Please enter a number between {low} and {high}")
+    
     def merge_playlists(self, playlist_names: List[str] = None, merged_name: str = None):
         """Merge multiple playlists into one."""
         if not playlist_names:
@@ -915,16 +1660,16 @@ class EnhancedIPTVManager:
         if not merged_name:
             merged_name = f"merged_{int(time.time())}"
         
+        # Gather all the channels first and append them in one go
+        sources = [self.loaded_playlists[name].get_channels()
+                   for name in playlist_names if name in self.loaded_playlists]
         merged_pl = M3UPlaylist()
-        total_channels = 0
-        
-        for name in playlist_names:
-            if name in self.loaded_playlists:
-                pl = self.loaded_playlists[name]
-                merged_pl.append_channels(pl.get_channels())
-                total_channels += pl.length()
+        merged_pl.append_channels(list(chain.from_iterable(sources)))
+        total_channels = merged_pl.length()
         
         # Add to loaded playlists
+        if merged_name in self.loaded_playlists:
+            self._invalidate_analysis(self.loaded_playlists[merged_name])
         self.loaded_playlists[merged_name] = merged_pl
         self.current_playlist = merged_pl
         
@@ -932,104 +1677,84 @@ class EnhancedIPTVManager:
     
     def _select_multiple_playlists(self) -> List[str]:
         """Interactive multiple playlist selection."""
+        rich = _rich()
         if RICH_AVAILABLE:
-            pl_table = Table(title="Select Playlists to Merge", box=box.ROUNDED)
-            pl_table.add_column("#", style="white", width=4)
-            pl_table.add_column("Name", style="cyan")
-            pl_table.add_column("Channels", style="green", width=10)
-            
-            playlist_names = list(self.loaded_playlists.keys())
-            
-            for i, name in enumerate(playlist_names):
-                pl = self.loaded_playlists[name]
-                pl_table.add_row(str(i + 1), name, f"{pl.length():,}")
+            pl_table = self._playlists_table("Select Playlists to Merge", show_groups=False)
+            playlist_names = tuple(self.loaded_playlists)
             
-            self.console.print(Panel(pl_table, title="🔀 Merge Playlists", title_align="left"))
+            self.console.print(rich.Panel(pl_table, title="🔀 Merge Playlists", title_align="left"))
             
             try:
-                choices = Prompt.ask(
+                choices = rich.Prompt.ask(
                     "Enter playlist numbers to merge (comma-separated)",
                     default="1,2"
                 )
                 
-                selected_names = []
-                for choice in choices.split(','):
-                    if choice.strip().isdigit():
-                        idx = int(choice.strip()) - 1
-                        if 0 <= idx < len(playlist_names):
-                            selected_names.append(playlist_names[idx])
-                
-                return selected_names
+                return [playlist_names[idx] for idx in _parse_indices(choices, len(playlist_names))]
                     
             except Exception:
                 return []
         else:
             print(f"{Fore.CYAN}{Style.BRIGHT}🔀 Select Playlists to Merge:{Style.RESET_ALL}")
-            playlist_names = list(self.loaded_playlists.keys())
-            for i, name in enumerate(playlist_names):
-                pl = self.loaded_playlists[name]
-                print(f"{Fore.WHITE}{i+1:2d}. {Fore.CYAN}{name} {Fore.GREEN}[{pl.length():,} channels]{Style.RESET_ALL}")
+            playlist_names = self._print_playlist_rows()
             
             choices = input(f"{Fore.CYAN}Enter playlist numbers (comma-separated): {Style.RESET_ALL}").strip()
             
-            selected_names = []
-            for choice in choices.split(','):
-                if choice.strip().isdigit():
-                    idx = int(choice.strip()) - 1
-                    if 0 <= idx < len(playlist_names):
-                        selected_names.append(playlist_names[idx])
-            
-            return selected_names
+            try:
+                return [playlist_names[idx] for idx in _parse_indices(choices, len(playlist_names))]
+            except ValueError as e:
+                self._print_error(str(e))
+                return []
     
     def display_enhanced_menu(self):
         """Display enhanced interactive menu."""
-        while True:
-            if RICH_AVAILABLE:
-                self._display_enhanced_rich_menu()
-            else:
-                self._display_enhanced_simple_menu()
-            
-            choice = input(f"{Fore.CYAN}Enter your choice (1-12, q to quit): {Style.RESET_ALL}").strip().lower()
-            
-            if choice == 'q':
-                self._print_info("Thank you for using Enhanced IPTV Manager! 👋")
-                break
-            elif choice == '1':
-                self._load_playlist_interactive()
-            elif choice == '2':
-                self.load_from_history()
-            elif choice == '3':
-                self._load_multiple_interactive()
-            elif choice == '4' and self.current_playlist:
-                self.display_playlist_overview()
-            elif choice == '5' and self.current_playlist:
-                self.display_group_analysis()
-            elif choice == '6' and self.current_playlist:
-                self.parse_tvg_tags_analysis()
-            elif choice == '7' and self.current_playlist:
-                self.export_with_group_filter()
-            elif choice == '8':
-                self.manage_loaded_playlists()
-            elif choice == '9' and len(self.loaded_playlists) >= 2:
-                self.merge_playlists()
-            elif choice == '10' and self.current_playlist:
-                self.display_series_analysis()
-            elif choice == '11' and self.current_playlist:
-                self._search_interactive()
-            elif choice == '12':
-                self._show_enhanced_help()
-            else:
-                if not self.current_playlist and choice in ['4','5','6','7','10','11']:
+        redraw = True
+        try:
+            while True:
+                # Persist whatever the previous command added to the history
+                self._flush_history()
+                # After a rejected choice nothing has changed and the menu is
+                # still right above the error, so only the prompt is repeated
+                if redraw:
+                    if RICH_AVAILABLE:
+                        self._display_enhanced_rich_menu()
+                    else:
+                        self._display_enhanced_simple_menu()
+                redraw = False
+            
+                choice = input(f"{Fore.CYAN}Enter your choice (1-12, q to quit): {Style.RESET_ALL}").strip().lower()
+            
+                if choice == 'q':
+                    self._print_info("Thank you for using Enhanced IPTV Manager! 👋")
+                    break
+                action = self._MENU_ACTIONS.get(choice)
+                if action is None:
+                    self._print_error("Invalid choice!")
+                elif choice in self._MENU_REQUIRES_PLAYLIST and not self.current_playlist:
                     self._print_warning("Please load a playlist first!")
-                elif choice == '9' and len(self.loaded_playlists) < 2:
+                elif choice in self._MENU_REQUIRES_MULTI and len(self.loaded_playlists) < 2:
                     self._print_warning("Need at least 2 playlists to merge!")
                 else:
-                    self._print_error("Invalid choice!")
+                    action(self)
+                    redraw = True
+        finally:
+            # Whether the user quits or interrupts the menu, keep the last history changes
+            self._flush_history()
     
     def _load_multiple_interactive(self):
         """Interactive multiple URL loading."""
-        if RICH_AVAILABLE:
-            urls_input = Prompt.ask("Enter URLs (comma-separated or one per line, end with empty line)")
+        rich = _rich()
+        if not sys.stdin.isatty():
+            # Piped input: take the whole block of URLs up to the first empty
+            # line from the stdin buffer, without a prompt per line
+            lines = []
+            for line in iter(sys.stdin.readline, ''):
+                if not line.strip():
+                    break
+                lines.append(line)
+            urls = [url.strip() for url in ','.join(lines).split(',') if url.strip()]
+        elif RICH_AVAILABLE:
+            urls_input = rich.Prompt.ask("Enter URLs (comma-separated or one per line, end with empty line)")
             urls = [url.strip() for url in urls_input.split(',') if url.strip()]
         else:
             print(f"{Fore.CYAN}Enter URLs (one per line, empty line to finish):{Style.RESET_ALL}")
@@ -1041,8 +1766,8 @@ class EnhancedIPTVManager:
                 urls.append(url)
         
         if urls:
-            sanitize = Confirm.ask("Sanitize playlists?") if RICH_AVAILABLE else \
-                     input(f"{Fore.CYAN}Sanitize playlists? (y/n): {Style.RESET_ALL}").lower() != 'n'
+            sanitize = rich.Confirm.ask("Sanitize playlists?") if RICH_AVAILABLE else \
+                     _confirm("Sanitize playlists? (y/n):")
             self.load_multiple_urls(urls, sanitize)
     
     def _search_interactive(self):
@@ -1052,16 +1777,26 @@ class EnhancedIPTVManager:
             self._print_warning("Search pattern cannot be empty!")
             return
         
-        case_sensitive = input(f"{Fore.CYAN}Case sensitive? (y/n, default=n): {Style.RESET_ALL}").strip().lower() == 'y'
+        case_sensitive = _confirm("Case sensitive? (y/n, default=n):", default=False)
         
         self.search_channels(pattern, case_sensitive=case_sensitive)
     
     def _display_enhanced_rich_menu(self):
         """Display enhanced rich interactive menu."""
-        # Create a beautiful header
-        header_text = Text("🎬 ENHANCED IPTV PLAYLIST MANAGER", style="bold bright_magenta")
-        header = Panel(header_text, style="bright_cyan", box=box.DOUBLE)
-        self.console.print(header)
+        rich = _rich()
+        if self._header_panel is None:
+            # Create a beautiful header
+            header_text = rich.Text("🎬 ENHANCED IPTV PLAYLIST MANAGER", style="bold bright_magenta")
+            self._header_panel = rich.Panel(header_text, style="bright_cyan", box=rich.box.DOUBLE)
+            
+            # Quick tips
+            tips = [
+                "💡 Pro tip: Use option 7 for advanced group-based exporting",
+                "💡 Try loading from history (option 2) for quick access",
+                "💡 Merge playlists (option 9) to combine multiple sources"
+            ]
+            self._tips_panel = rich.Panel("\n".join(tips), title="💡 Quick Tips", border_style="yellow")
+        renderables = [self._header_panel]
         
         # Current status panel
         status_info = []
@@ -1074,203 +1809,146 @@ class EnhancedIPTVManager:
             status_info.append(f"[bold blue]📚 Loaded:[/bold blue] {len(self.loaded_playlists)} playlists")
         
         if self.url_history:
-            success_count = sum(1 for entry in self.url_history if entry.get('success', False))
+            success_count = sum(1 for entry in self.url_history.values() if entry.get('success', False))
             status_info.append(f"[bold cyan]📜 History:[/bold cyan] {success_count}/{len(self.url_history)} successful")
         
         if status_info:
-            status_panel = Panel("\n".join(status_info), title="📊 Current Status", border_style="green")
-            self.console.print(status_panel)
+            status_panel = rich.Panel("\n".join(status_info), title="📊 Current Status", border_style="green")
+            renderables.append(status_panel)
         
+        renderables.extend((self._menu_panel(), self._tips_panel, ""))
+        self._buffered_print(*renderables)
+    
+    def _menu_panel(self):
+        """Return the Rich main menu panel for the current state, building it once per state."""
+        # The menu rows only depend on these, not on the playlist contents
+        key = (self.current_playlist is not None, len(self.loaded_playlists), len(self.url_history))
+        menu_panel = self._menu_panels.get(key)
+        if menu_panel is not None:
+            return menu_panel
+        
+        rich = _rich()
         # Main menu
-        menu_table = Table(show_header=False, box=box.ROUNDED, padding=(0, 2))
+        menu_table = rich.Table(show_header=False, box=rich.box.ROUNDED, padding=(0, 2))
         menu_table.add_column("Option", style="bold cyan", width=6)
         menu_table.add_column("Description", style="white")
         menu_table.add_column("Status", style="dim", width=12)
         
-        menu_items = [
-            ("1", "📥 Load Single Playlist", "Always"),
-            ("2", "📜 Load from History", f"{len(self.url_history)} saved"),
-            ("3", "📚 Load Multiple URLs", "Batch mode"),
-            ("4", "📊 Playlist Overview", "Current only"),
-            ("5", "📁 Group Analysis", "Top 10 groups"),
-            ("6", "🏷️ TVG Tag Analysis", "Tag stats"),
-            ("7", "💾 Smart Export", "Group filter"),
-            ("8", "🔀 Manage Playlists", f"{len(self.loaded_playlists)} loaded"),
-            ("9", "🔄 Merge Playlists", f"{len(self.loaded_playlists)} available"),
-            ("10", "🎭 Series Detection", "Auto-detect"),
-            ("11", "🔍 Search Channels", "Regex support"),
-            ("12", "❓ Help & Guide", "Documentation"),
-            ("q", "🚪 Exit Manager", "Safe exit")
-        ]
-        
-        for key, desc, status in menu_items:
+        counts = {'history': len(self.url_history), 'loaded': len(self.loaded_playlists)}
+        for option, desc, status in _MENU_ITEMS:
+            status = status.format_map(counts)
             # Color code based on availability
-            if key in ['4','5','6','7','10','11'] and not self.current_playlist:
+            if option in self._MENU_REQUIRES_PLAYLIST and self.current_playlist is None:
                 status_style = "red"
-            elif key == '9' and len(self.loaded_playlists) < 2:
+            elif option in self._MENU_REQUIRES_MULTI and len(self.loaded_playlists) < 2:
                 status_style = "red"
             else:
                 status_style = "dim"
             
             menu_table.add_row(
-                f"[bold cyan]{key}[/bold cyan]",
+                f"[bold cyan]{option}[/bold cyan]",
                 desc,
                 f"[{status_style}]{status}[/{status_style}]"
             )
         
-        menu_panel = Panel(menu_table, title="🎯 Main Menu", border_style="bright_blue")
-        self.console.print(menu_panel)
-        
-        # Quick tips
-        tips = [
-            "💡 Pro tip: Use option 7 for advanced group-based exporting",
-            "💡 Try loading from history (option 2) for quick access",
-            "💡 Merge playlists (option 9) to combine multiple sources"
-        ]
-        
-        tips_panel = Panel("\n".join(tips), title="💡 Quick Tips", border_style="yellow")
-        self.console.print(tips_panel)
-        self.console.print()
+        menu_panel = rich.Panel(menu_table, title="🎯 Main Menu", border_style="bright_blue")
+        self._menu_panels[key] = menu_panel
+        return menu_panel
     
     def _display_enhanced_simple_menu(self):
         """Display enhanced simple text menu."""
-        print(f"{Fore.MAGENTA}{Style.BRIGHT}🎬 ENHANCED IPTV PLAYLIST MANAGER{Style.RESET_ALL}")
-        print()
+        lines = [_SIMPLE_MENU_HEADER]
         
         # Status display
         if self.current_playlist:
-            print(f"{Fore.GREEN}✓ Current Playlist: {self.current_playlist.length():,} channels{Style.RESET_ALL}")
+            lines.append(_SIMPLE_CURRENT_FMT % f"{self.current_playlist.length():,}")
         else:
-            print(f"{Fore.YELLOW}⚠ No playlist loaded{Style.RESET_ALL}")
+            lines.append(_SIMPLE_NO_PLAYLIST)
         
         if self.loaded_playlists:
-            print(f"{Fore.BLUE}📚 Loaded: {len(self.loaded_playlists)} playlists{Style.RESET_ALL}")
+            lines.append(_SIMPLE_LOADED_FMT % len(self.loaded_playlists))
         
         if self.url_history:
-            success_count = sum(1 for entry in self.url_history if entry.get('success', False))
-            print(f"{Fore.CYAN}📜 History: {success_count}/{len(self.url_history)} successful{Style.RESET_ALL}")
-        
-        print()
-        print(f"{Fore.CYAN}{Style.BRIGHT}🎯 Main Menu:{Style.RESET_ALL}")
-        print()
+            success_count = sum(1 for entry in self.url_history.values() if entry.get('success', False))
+            lines.append(_SIMPLE_HISTORY_FMT % (success_count, len(self.url_history)))
         
-        menu_items = [
-            ("1", "📥 Load Single Playlist"),
-            ("2", "📜 Load from History"),
-            ("3", "📚 Load Multiple URLs"),
-            ("4", "📊 Playlist Overview"),
-            ("5", "📁 Group Analysis"),
-            ("6", "🏷️ TVG Tag Analysis"),
-            ("7", "💾 Smart Export"),
-            ("8", "🔀 Manage Playlists"),
-            ("9", "🔄 Merge Playlists"),
-            ("10", "🎭 Series Detection"),
-            ("11", "🔍 Search Channels"),
-            ("12", "❓ Help & Guide"),
-            ("q", "🚪 Exit Manager")
-        ]
+        lines.append(_SIMPLE_MENU_TITLE)
         
-        for key, desc in menu_items:
+        for key, line in _SIMPLE_MENU_LINES:
             status = ""
-            if key in ['4','5','6','7','10','11'] and not self.current_playlist:
-                status = f"{Fore.RED} [needs playlist]{Style.RESET_ALL}"
-            elif key == '9' and len(self.loaded_playlists) < 2:
-                status = f"{Fore.RED} [need 2+ playlists]{Style.RESET_ALL}"
+            if key in self._MENU_REQUIRES_PLAYLIST and not self.current_playlist:
+                status = _NEEDS_PLAYLIST_STATUS
+            elif key in self._MENU_REQUIRES_MULTI and len(self.loaded_playlists) < 2:
+                status = _NEEDS_MULTI_STATUS
             
-            print(f"{Fore.CYAN}{key}.{Style.RESET_ALL} {desc}{status}")
+            lines.append(line + status)
         
-        print()
-        print(f"{Fore.YELLOW}💡 Pro tip: Use option 7 for advanced group-based exporting{Style.RESET_ALL}")
-        print()
+        lines.append(_SIMPLE_MENU_FOOTER)
+        # A single write for the whole menu
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _show_enhanced_help(self):
         """Display enhanced help information."""
         if RICH_AVAILABLE:
-            help_text = """
-[b]🎯 Enhanced IPTV Playlist Manager - Complete Guide[/b]
-
-[bold cyan]🚀 Core Features:[/bold cyan]
-• [green]Smart Loading[/green]: Load from URLs, history, or multiple sources
-• [green]Advanced Analysis[/green]: Group statistics, TVG tag analysis, series detection
-• [green]Smart Exporting[/green]: Filter by groups with multi-select interface
-• [green]Playlist Management[/green]: Merge, switch between, and manage multiple playlists
-
-[bold cyan]💾 Export Features (Option 7):[/bold cyan]
-• [yellow]Multi-Column Group Display[/yellow]: View all groups in organized columns
-• [yellow]Flexible Selection[/yellow]: Use numbers, ranges (1-5), or toggle existing selections
-• [yellow]Smart Filtering[/yellow]: Include or exclude selected groups
-• [yellow]Export Summary[/yellow]: See exactly what will be exported before saving
-
-[bold cyan]🎮 Quick Start:[/bold cyan]
-1. Load a playlist (option 1 or 2)
-2. Analyze it (options 4-6) 
-3. Export filtered content (option 7)
-4. Manage multiple sources (options 8-9)
-
-[bold cyan]🔗 Sample URLs:[/bold cyan]
-• https://iptv-org.github.io/iptv/categories/entertainment.m3u
-• https://iptv-org.github.io/iptv/categories/sports.m3u
-• https://iptv-org.github.io/iptv/categories/news.m3u
-
-[bold yellow]💡 Pro Tip:[/bold yellow] Use range selection (e.g., "1-5,10,15-20") in group export for quick bulk operations!
-            """
-            self.console.print(Panel(help_text, title="❓ Complete Help Guide", title_align="left", border_style="green"))
+            if self._help_panel is None:
+                # Static content: parse the markup and build the panel only once
+                rich = _rich()
+                self._help_panel = rich.Panel(rich.Text.from_markup(_RICH_HELP_TEXT), title="❓ Complete Help Guide",
+                                              title_align="left", border_style="green")
+            self.console.print(self._help_panel)
         else:
-            print(f"{Fore.CYAN}{Style.BRIGHT}🎯 Enhanced IPTV Manager - Complete Guide{Style.RESET_ALL}")
-            print()
-            print(f"{Fore.GREEN}🚀 Core Features:{Style.RESET_ALL}")
-            print("• Smart Loading: Load from URLs, history, or multiple sources")
-            print("• Advanced Analysis: Group stats, TVG tags, series detection")
-            print("• Smart Exporting: Filter by groups with multi-select")
-            print("• Playlist Management: Merge and manage multiple playlists")
-            print()
-            print(f"{Fore.YELLOW}💾 Export Features (Option 7):{Style.RESET_ALL}")
-            print("• Multi-Column Group Display: Organized group viewing")
-            print("• Flexible Selection: Use numbers, ranges (1-5), or toggle")
-            print("• Smart Filtering: Include or exclude selected groups")
-            print("• Export Summary: Preview before saving")
-            print()
-            print(f"{Fore.CYAN}🎮 Quick Start:{Style.RESET_ALL}")
-            print("1. Load a playlist (option 1 or 2)")
-            print("2. Analyze it (options 4-6)")
-            print("3. Export filtered content (option 7)")
-            print("4. Manage multiple sources (options 8-9)")
-            print()
-            print(f"{Fore.BLUE}🔗 Sample URLs:{Style.RESET_ALL}")
-            print("https://iptv-org.github.io/iptv/categories/entertainment.m3u")
-            print("https://iptv-org.github.io/iptv/categories/sports.m3u")
-            print("https://iptv-org.github.io/iptv/categories/news.m3u")
-            print()
-            print(f"{Fore.YELLOW}💡 Pro Tip: Use range selection (e.g., '1-5,10,15-20') in group export!{Style.RESET_ALL}")
-            print()
+            sys.stdout.write(_SIMPLE_HELP_TEXT)
     
+    def _buffered_print(self, *renderables):
+        """Print several Rich renderables with a single console.print call."""
+        self.console.print(_rich().Group(*renderables))
+
     def _print_success(self, message: str):
         """Print success message."""
         if RICH_AVAILABLE:
             self.console.print(f"[bold green]✅ {message}[/bold green]")
         else:
-            print(f"{Fore.GREEN}✅ {message}{Style.RESET_ALL}")
+            print(_SUCCESS_FMT % message)
     
     def _print_error(self, message: str):
         """Print error message."""
         if RICH_AVAILABLE:
             self.console.print(f"[bold red]❌ {message}[/bold red]")
         else:
-            print(f"{Fore.RED}❌ {message}{Style.RESET_ALL}")
+            print(_ERROR_FMT % message)
     
     def _print_warning(self, message: str):
         """Print warning message."""
         if RICH_AVAILABLE:
             self.console.print(f"[bold yellow]⚠️  {message}[/bold yellow]")
         else:
-            print(f"{Fore.YELLOW}⚠️  {message}{Style.RESET_ALL}")
+            print(_WARNING_FMT % message)
     
     def _print_info(self, message: str):
         """Print info message."""
         if RICH_AVAILABLE:
             self.console.print(f"[bold blue]ℹ️  {message}[/bold blue]")
         else:
-            print(f"{Fore.BLUE}ℹ️  {message}{Style.RESET_ALL}")
+            print(_INFO_FMT % message)
+
+    # Main menu dispatch: choice -> handler, plus the choices that need a
+    # current playlist or at least two loaded playlists
+    _MENU_ACTIONS = {
+        '1': _load_playlist_interactive,
+        '2': load_from_history,
+        '3': _load_multiple_interactive,
+        '4': display_playlist_overview,
+        '5': display_group_analysis,
+        '6': parse_tvg_tags_analysis,
+        '7': export_with_group_filter,
+        '8': manage_loaded_playlists,
+        '9': merge_playlists,
+        '10': display_series_analysis,
+        '11': _search_interactive,
+        '12': _show_enhanced_help,
+    }
+    _MENU_REQUIRES_PLAYLIST = frozenset({'4', '5', '6', '7', '10', '11'})
+    _MENU_REQUIRES_MULTI = frozenset({'9'})
 
 
 def check_dependencies():
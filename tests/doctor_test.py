@@ -130,6 +130,29 @@ class TestM3UDoctor(unittest.TestCase):
         fixed_pl = M3UPlaylistDoctor.sanitize(pl)
         self.assertEqual(expected, fixed_pl)
 
+    def test_needs_sanitize_channel(self) -> None:
+        self.assertFalse(IPTVChannelDoctor.needs_sanitize(IPTVChannel()))
+        self.assertFalse(IPTVChannelDoctor.needs_sanitize(
+            IPTVChannel(attributes={
+                IPTVAttr.TVG_ID.value: "a",
+                IPTVAttr.TVG_LOGO.value: "https://site.com/image%2Cfile.jpg",
+                "x-custom": "b"
+            })
+        ))
+        self.assertTrue(IPTVChannelDoctor.needs_sanitize(IPTVChannel(attributes={"tvg-ID": "a"})))
+        self.assertTrue(IPTVChannelDoctor.needs_sanitize(
+            IPTVChannel(attributes={IPTVAttr.GROUP_TITLE.value: "News, Sports"})
+        ))
+        self.assertTrue(IPTVChannelDoctor.needs_sanitize(
+            IPTVChannel(attributes={IPTVAttr.TVG_LOGO.value: "https://site.com/image,file.jpg"})
+        ))
+
+    def test_needs_sanitize_playlist(self) -> None:
+        for filename in ("tests/resources/m3u_plus.m3u", "tests/resources/m3u_plus_unencoded_logo.m3u"):
+            pl = playlist.loadf(filename)
+            self.assertEqual(M3UPlaylistDoctor.sanitize(pl) != pl, M3UPlaylistDoctor.needs_sanitize(pl), filename)
+        self.assertFalse(M3UPlaylistDoctor.needs_sanitize(M3UPlaylist()))
+
     def test_sanitize_duration(self) -> None:
         pl = playlist.loadl(test_data.space_before_comma.split("\n"))
         self.assertEqual(4, pl.length())
@@ -0,0 +1,249 @@
+import glob
+import io
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import httpretty
+
+import main
+from ipytv import playlist
+from ipytv.exceptions import MalformedPlaylistException
+from tests import test_data
+
+
+class TestParseIndices(unittest.TestCase):
+
+    def test_numbers_and_ranges(self):
+        self.assertEqual([0, 2, 4, 5, 6, 7, 8, 9], main._parse_indices("1,3,5-10", 20))
+        self.assertEqual([1, 2, 3], main._parse_indices(" 2 - 4 ", 20))
+
+    def test_reversed_range_selects_nothing(self):
+        self.assertEqual([], main._parse_indices("10-5", 20))
+
+    def test_out_of_range_numbers_are_skipped(self):
+        self.assertEqual([0, 4], main._parse_indices("0,1,5,6,99", 5))
+        self.assertEqual([3, 4], main._parse_indices("4-99", 5))
+
+    def test_duplicates_keep_input_order(self):
+        self.assertEqual([4, 0, 1, 2], main._parse_indices("5,1-3,2,5", 10))
+
+    def test_empty_parts_are_skipped(self):
+        self.assertEqual([0, 1], main._parse_indices("1,, 2,", 10))
+        self.assertEqual([], main._parse_indices("", 10))
+
+    def test_invalid_part_raises(self):
+        for selection in ["x", "1,x", "1-", "-3", "1.5"]:
+            with self.subTest(selection=selection):
+                with self.assertRaises(ValueError):
+                    main._parse_indices(selection, 10)
+
+
+class TestParseStream(unittest.TestCase):
+
+    def test_files_parse_like_loadf(self):
+        for filename in sorted(glob.glob("tests/resources/*.m3u")):
+            with self.subTest(filename=filename):
+                with open(filename, encoding="utf-8") as content:
+                    self.assertEqual(playlist.loadf(filename), main.EnhancedIPTVManager._parse_stream(content))
+
+    def test_edge_cases_parse_like_loads(self):
+        cases = [
+            test_data.split_quoted_string,
+            test_data.unquoted_attributes,
+            test_data.space_before_comma,
+            # header-only playlist, with its attributes
+            '#EXTM3U x-tvg-url="http://myown.link/epg.xml"\n',
+            # adjacent #EXTINF rows, tags carried as extras and blank rows
+            "#EXTM3U\n\n#EXTINF:-1,No URL\n#EXTINF:-1,Second\n#EXTVLCOPT:http-user-agent=ipytv\n"
+            "#EXTGRP:News\nhttp://myown.link/second\n\n",
+            # a trailing #EXTINF row without url
+            "#EXTM3U\n#EXTINF:-1,First\nhttp://myown.link/first\n#EXTINF:-1,Last\n",
+        ]
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertEqual(playlist.loads(case), main.EnhancedIPTVManager._parse_stream(io.StringIO(case)))
+
+    def test_missing_or_misplaced_header_is_malformed(self):
+        for case in ["", "\n\n", "#EXTINF:-1,First\nhttp://myown.link/first\n",
+                     "#EXTINF:-1,First\n#EXTM3U\nhttp://myown.link/first\n"]:
+            with self.subTest(case=case):
+                with self.assertRaises(MalformedPlaylistException):
+                    main.EnhancedIPTVManager._parse_stream(io.StringIO(case))
+
+
+class TestSavedPlaylists(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.pl = playlist.loadf("tests/resources/m3u_plus.m3u")
+
+    def tearDown(self) -> None:
+        self.data_dir.cleanup()
+
+    def test_columns_round_trip(self):
+        for use_orjson in sorted({False, main.ORJSON_AVAILABLE}):
+            with self.subTest(orjson=use_orjson), mock.patch.object(main, "ORJSON_AVAILABLE", use_orjson):
+                columns = main._json_loads(main._json_dumps(main._playlist_to_columns(self.pl)))
+                self.assertEqual(self.pl, main._playlist_from_columns(columns))
+
+    def test_legacy_pickle_store_is_converted_once(self):
+        legacy_file = os.path.join(self.data_dir.name, "saved_playlists.pkl")
+        with open(legacy_file, "wb") as f:
+            pickle.dump({"saved": self.pl}, f)
+        manager = main.EnhancedIPTVManager(data_dir=self.data_dir.name)
+        self.assertEqual({"saved": self.pl}, manager.saved_playlists)
+        self.assertTrue(manager.playlists_file.exists())
+        # The JSON store now wins over a pickle store left behind
+        with open(legacy_file, "wb") as f:
+            pickle.dump({}, f)
+        manager = main.EnhancedIPTVManager(data_dir=self.data_dir.name)
+        self.assertEqual({"saved": self.pl}, manager.saved_playlists)
+
+
+class TestSearchIndexed(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.data_dir = tempfile.TemporaryDirectory()
+        cls.manager = main.EnhancedIPTVManager(data_dir=cls.data_dir.name)
+        cls.pl = playlist.loadf("tests/resources/iptv-org.m3u")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.data_dir.cleanup()
+
+    def test_results_equal_playlist_search(self):
+        patterns = [
+            # literals, answered by the equality index
+            "News", "news", "NEWS", "Music Channel", "music channel", "RO", "ro", "", "Nope",
+            # metacharacters, matched once per distinct value
+            ".*News.*", ".*news.*", "^A.*", "BBC.*", "[A-C].*", "News|Music", r".*\d+.*", ".+HD", "N.w.",
+            # inline flags
+            "(?i)news", "(?i).*bbc.*", "(?-i:News)", "(?i:NEWS)|Music",
+        ]
+        for where in (["name", "attributes.group-title"], ["name"], ["attributes.tvg-country"]):
+            for pattern in patterns:
+                for case_sensitive in (True, False):
+                    with self.subTest(pattern=pattern, where=where, case_sensitive=case_sensitive):
+                        self.assertEqual(self.pl.search(pattern, where, case_sensitive),
+                                         self.manager._search_indexed(self.pl, pattern, where, case_sensitive))
+
+    def test_invalid_patterns_raise_like_playlist_search(self):
+        for pattern in ["(", "[a-", "*News", "(?P<x)"]:
+            for case_sensitive in (True, False):
+                with self.subTest(pattern=pattern, case_sensitive=case_sensitive):
+                    with self.assertRaises(re.error):
+                        self.pl.search(pattern, ["name"], case_sensitive)
+                    with self.assertRaises(re.error):
+                        self.manager._search_indexed(self.pl, pattern, ["name"], case_sensitive)
+
+
+class TestPlaylistCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        with open("tests/resources/m3u_plus.m3u", encoding="utf-8") as content:
+            self.body = content.read()
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.manager = main.EnhancedIPTVManager(data_dir=self.data_dir.name)
+        httpretty.enable()
+
+    def tearDown(self) -> None:
+        httpretty.disable()
+        httpretty.reset()
+        self.data_dir.cleanup()
+
+    def _cached_files(self):
+        return list(self.manager.cache_dir.glob('*.json'))
+
+    def test_cache_keeps_the_most_recent_downloads(self):
+        urls = [f"http://myown.link:80/luke/playlist{i}.m3u" for i in range(main.MAX_CACHED_PLAYLISTS + 2)]
+        for url in urls:
+            httpretty.register_uri(httpretty.GET, url, body=self.body, adding_headers={"ETag": '"v1"'})
+            self.manager._load_streaming(url)
+        self.assertEqual(main.MAX_CACHED_PLAYLISTS, len(self._cached_files()))
+        # The last download is served from the cache on a 304 answer
+        httpretty.register_uri(httpretty.GET, urls[-1], status=304)
+        version, pl = self.manager._load_streaming(urls[-1])
+        self.assertEqual(('"v1"', None), version)
+        self.assertEqual(4, pl.length())
+
+    def test_download_without_validators_drops_the_cached_copy(self):
+        url = "http://myown.link:80/luke/playlist.m3u"
+        httpretty.register_uri(httpretty.GET, url, body=self.body, adding_headers={"ETag": '"v1"'})
+        self.manager._load_streaming(url)
+        self.assertEqual(1, len(self._cached_files()))
+        httpretty.register_uri(httpretty.GET, url, body=self.body)
+        version, pl = self.manager._load_streaming(url)
+        self.assertIsNone(version)
+        self.assertEqual(4, pl.length())
+        self.assertEqual([], self._cached_files())
+
+
+class TestLoadMultipleUrls(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.manager = main.EnhancedIPTVManager(data_dir=self.data_dir.name)
+        httpretty.enable()
+
+    def tearDown(self) -> None:
+        httpretty.disable()
+        httpretty.reset()
+        self.data_dir.cleanup()
+
+    def test_last_url_becomes_the_current_playlist(self):
+        first = "http://myown.link:80/luke/first.m3u"
+        last = "http://myown.link:80/luke/last.m3u"
+        last_answered = threading.Event()
+
+        def respond_first(request, uri, headers):
+            # The first download only ends after the last one
+            last_answered.wait(5)
+            return 200, headers, "#EXTM3U\n#EXTINF:-1,First\nhttp://myown.link/first\n"
+
+        def respond_last(request, uri, headers):
+            last_answered.set()
+            return 200, headers, "#EXTM3U\n#EXTINF:-1,Last\nhttp://myown.link/last\n"
+
+        httpretty.register_uri(httpretty.GET, first, body=respond_first)
+        httpretty.register_uri(httpretty.GET, last, body=respond_last)
+        self.manager.load_multiple_urls([first, last], sanitize=False)
+        self.assertEqual(2, len(self.manager.loaded_playlists))
+        self.assertEqual("Last", self.manager.current_playlist.get_channel(0).name)
+
+
+class TestLoadPlaylist(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.manager = main.EnhancedIPTVManager(data_dir=self.data_dir.name)
+
+    def tearDown(self) -> None:
+        self.data_dir.cleanup()
+
+    def test_reloading_an_unchanged_file_keeps_a_single_name(self):
+        path = shutil.copy("tests/resources/m3u_plus.m3u", self.data_dir.name)
+        self.assertTrue(self.manager.load_playlist_from_url(path))
+        pl = self.manager.current_playlist
+        self.assertTrue(self.manager.load_playlist_from_url(path))
+        self.assertIs(pl, self.manager.current_playlist)
+        self.assertEqual([pl], list(self.manager.loaded_playlists.values()))
+
+    def test_parsed_attributes_are_interned(self):
+        with open("tests/resources/m3u_plus.m3u", encoding="utf-8") as content:
+            channels = self.manager._parse_stream(content).get_channels()
+        # Channels 2 and 3 are both in the "Italia" group
+        first, second = channels[1].attributes, channels[2].attributes
+        key = next(k for k in first if k == "group-title")
+        self.assertIs(key, next(k for k in second if k == "group-title"))
+        self.assertIs(first[key], second[key])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import io
 import itertools
 import json
 import unittest
@@ -323,6 +324,24 @@ class TestM3UPlaylist(unittest.TestCase):
             expected_json = json.load(json_file)
             self.assertEqual(expected_json, json.loads(pl_json))
 
+    def test_write_m3u_plus_playlist(self):
+        pl = playlist.loadf("tests/resources/m3u_plus.m3u")
+        out = io.StringIO()
+        pl.write_m3u_plus_playlist(out)
+        self.assertEqual(pl.to_m3u_plus_playlist(), out.getvalue())
+
+    def test_write_m3u8_playlist(self):
+        pl = playlist.loadf("tests/resources/m3u_plus.m3u")
+        out = io.StringIO()
+        pl.write_m3u8_playlist(out)
+        self.assertEqual(pl.to_m3u8_playlist(), out.getvalue())
+
+    def test_write_json_playlist(self):
+        for pl in [playlist.loadf("tests/resources/m3u_plus.m3u"), M3UPlaylist()]:
+            out = io.StringIO()
+            pl.write_json_playlist(out)
+            self.assertEqual(pl.to_json_playlist(), out.getvalue())
+
     def test_clone(self):
         pl = playlist.loadf("tests/resources/m3u_plus.m3u")
 
@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import httpretty
+
+try:
+    import tui
+    TEXTUAL_AVAILABLE = tui.TEXTUAL_AVAILABLE
+except ImportError:
+    TEXTUAL_AVAILABLE = False
+
+
+@unittest.skipUnless(TEXTUAL_AVAILABLE, "textual is not installed")
+class TestIPTVTUILoad(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        # The backend keeps its URL history in the working directory
+        self.cwd = os.getcwd()
+        with open("tests/resources/m3u_plus.m3u", encoding="utf-8") as content:
+            self.body = content.read()
+        self.data_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.data_dir.name)
+        # Holds the downloads until the test lets them through
+        self.release = threading.Event()
+        httpretty.enable()
+
+    def tearDown(self) -> None:
+        self.release.set()
+        httpretty.disable()
+        httpretty.reset()
+        os.chdir(self.cwd)
+        self.data_dir.cleanup()
+
+    def _register(self, url: str) -> None:
+        def respond(request, uri, headers):
+            self.release.wait(5)
+            return 200, headers, self.body
+        httpretty.register_uri(httpretty.GET, url, body=respond)
+
+    async def test_second_load_is_refused_while_loading(self):
+        url = "http://myown.link:80/luke/playlist.m3u"
+        self._register(url)
+        app = tui.IPTVTUI()
+        async with app.run_test() as pilot:
+            app.manager.pending_load = (url, True)
+            app._start_pending_load()
+            await pilot.pause()
+            self.assertTrue(app._loading())
+            self.assertEqual(1, len(app.query("#load_progress")))
+            app.main_menu_widget.selected_option = 0
+            # Refused before the app suspends, which run_test does not support
+            app.action_select_option()
+            await pilot.pause()
+            self.assertIn("A playlist is still loading, please wait",
+                          [notification.message for notification in app._notifications])
+            self.assertEqual(1, len(app.query("#load_progress")))
+            self.release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            self.assertFalse(app._loading())
+            self.assertEqual(0, len(app.query("#load_progress")))
+            self.assertEqual(1, len(app.manager.loaded_playlists))
+
+    async def test_failed_load_is_recorded_on_the_ui_thread(self):
+        url = "http://myown.link:80/luke/missing.m3u"
+        httpretty.register_uri(httpretty.GET, url, status=404)
+        app = tui.IPTVTUI()
+        async with app.run_test() as pilot:
+            app.manager.pending_load = (url, True)
+            app._start_pending_load()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            self.assertIsNone(app.manager.current_playlist)
+            self.assertFalse(app.manager.url_history[url]['success'])
+            self.assertIn("❌ Failed to load playlist",
+                          [notification.message for notification in app._notifications])
+        # The app saves the history as it exits
+        with open("iptv_data/url_history.json", encoding="utf-8") as history:
+            self.assertEqual([url], [entry['url'] for entry in json.load(history)])
+
+
+if __name__ == '__main__':
+    unittest.main()
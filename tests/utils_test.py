@@ -1,7 +1,7 @@
 import unittest
 
 from ipytv import playlist
-from ipytv.utils import extract_series, extract_show_name, is_episode_from_series
+from ipytv.utils import extract_series, extract_show_name, find_episode_pattern, is_episode_from_series
 
 
 class TestUtils(unittest.TestCase):
@@ -129,5 +129,12 @@ class TestUtils(unittest.TestCase):
             expected = bool(test["is_series"])
             self.assertTrue(is_episode_from_series(title) is expected, f"Failed for {title}")
 
+    def test_find_episode_pattern(self) -> None:
+        for title in ["Crappy Days 01x25 - The Bonz", "Crappy Days S01 E25 - The Bonz", "Crappy Days.25"]:
+            pattern = find_episode_pattern(title)
+            self.assertIsNotNone(pattern, f"Failed for {title}")
+            self.assertEqual(extract_show_name(title), pattern.sub("", title).strip())
+        self.assertIsNone(find_episode_pattern("The Talking Dead 1920x1024"))
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,30 +9,30 @@ full keyboard navigation, interactive elements, and terminal-optimized UI.
 
 import sys
 import os
+import threading
 import time
 import json
-import pickle
-from typing import Dict, List, Optional, Set, Any
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Any
 from pathlib import Path
 from urllib.parse import urlparse
 from dataclasses import dataclass
+from enum import IntFlag, auto
 
 # --- TUI-specific imports ---
 try:
     from textual.app import App, ComposeResult
-    from textual.widgets import Header, Footer, Static, Label
-    from textual.containers import Container
-    from textual.screen import Screen
+    from textual.widgets import Header, Footer, ProgressBar, Static
+    from textual.reactive import reactive
+    from textual.worker import Worker, WorkerState
     from rich.console import Console 
-    from rich.table import Table
+    from rich.cells import cell_len
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
     from rich.text import Text
-    from rich.prompt import Prompt, Confirm, IntPrompt
-    from rich import box
-    from rich.layout import Layout
     from rich.align import Align
-    from rich.padding import Padding
+    # rich.progress and rich.prompt are only imported by the handlers using them
     TEXTUAL_AVAILABLE = True
 except ImportError:
     TEXTUAL_AVAILABLE = False
@@ -40,6 +40,13 @@ except ImportError:
 # Remove pynput imports as Textual handles input
 KEYBOARD_AVAILABLE = True
 
+# orjson reads and writes the URL history faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # IPyTV imports
 from ipytv import playlist
 from ipytv.doctor import M3UPlaylistDoctor
@@ -49,6 +56,64 @@ from ipytv.exceptions import URLException, MalformedPlaylistException
 from ipytv.playlist import M3UPlaylist
 
 
+@lru_cache(maxsize=256)
+def _netloc(url: str) -> str:
+    """The network location of a URL, parsed once per URL."""
+    return urlparse(url).netloc
+
+
+class OpType(IntFlag):
+    """The operation of a menu entry; being flags, a set of them is a single mask."""
+    URL = auto()
+    HISTORY = auto()
+    MULTIPLE = auto()
+    OVERVIEW = auto()
+    GROUPS = auto()
+    TAGS = auto()
+    EXPORT = auto()
+    MANAGE = auto()
+    MERGE = auto()
+    SERIES = auto()
+    SEARCH = auto()
+    SETTINGS = auto()
+    HELP = auto()
+    EXIT = auto()
+
+
+# Menu operations that need a playlist to be loaded
+_NEEDS_PLAYLIST = OpType.OVERVIEW | OpType.GROUPS | OpType.TAGS | OpType.EXPORT | OpType.SERIES | OpType.SEARCH
+
+# Seconds between two renders of the menu while navigating (60 fps)
+_FRAME_INTERVAL = 1 / 60
+
+# Seconds between two saves of a changed URL history while the app runs
+_HISTORY_FLUSH_INTERVAL = 5.0
+
+# Colors of the _show_message types
+_MESSAGE_COLORS = {
+    "success": "green",
+    "error": "red",
+    "warning": "yellow",
+    "info": "blue"
+}
+
+
+class MenuItem(NamedTuple):
+    """An entry of the main menu, with what its operation needs to run."""
+    label: str
+    handler: Callable[[], None]
+    op_type: OpType
+    needs_playlist: bool
+    needs_multiple: bool
+    needs_history: bool
+
+    @classmethod
+    def create(cls, label: str, handler: Callable[[], None], op_type: OpType) -> 'MenuItem':
+        """Build a menu entry, working out its prerequisites from its operation type."""
+        return cls(label, handler, op_type, bool(op_type & _NEEDS_PLAYLIST), op_type is OpType.MERGE,
+                   op_type is OpType.HISTORY)
+
+
 @dataclass
 class AppState:
     """Application state for TUI management."""
@@ -69,97 +134,155 @@ class IPTV_Backend:
     def __init__(self, data_dir: str = "iptv_data"):
         self.current_playlist = None
         self.loaded_playlists: Dict[str, M3UPlaylist] = {}
-        # Keep console for rich formatting outside of Textual widgets if needed
-        self.console = Console() if TEXTUAL_AVAILABLE else None 
+        # (url, sanitize) asked for by _load_playlist_tui, for the app to load
+        # in a worker thread once it has the terminal back
+        self.pending_load: Optional[Tuple[str, bool]] = None
+        # Bumped whenever the playlists or the history change, so that the
+        # views can tell when what they show is stale
+        self.state_version = 0
+        # Console for rich formatting outside of Textual widgets, created on
+        # first use by the blocking handlers (see the console property)
+        self._console: Optional[Console] = None
+        # Set by the app while it runs, to show errors as notifications
+        # instead of printing them over its screen
+        self.error_handler: Optional[Callable[[str], None]] = None
         self.data_dir = Path(data_dir)
         self.history_file = self.data_dir / "url_history.json"
         
         # Initialize data directory
         self.data_dir.mkdir(exist_ok=True)
         self.url_history = self._load_url_history()
+        self._history_dirty = False
         
         # TUI Configuration - Kept here as data
-        self.menu_options = [
-            ("📥 Load Playlist", self._load_playlist_tui, "url"),
-            ("📜 Load from History", self._load_from_history_tui, "history"),
-            ("📚 Load Multiple", self._load_multiple_tui, "multiple"),
-            ("📊 Playlist Overview", self._show_overview_tui, "overview"),
-            ("📁 Group Analysis", self._show_groups_tui, "groups"),
-            ("🏷️ TVG Tag Analysis", self._show_tags_tui, "tags"),
-            ("💾 Smart Export", self._export_tui, "export"),
-            ("🔀 Manage Playlists", self._manage_playlists_tui, "manage"),
-            ("🔄 Merge Playlists", self._merge_tui, "merge"),
-            ("🎭 Series Detection", self._series_tui, "series"),
-            ("🔍 Search Channels", self._search_tui, "search"),
-            ("⚙️ Settings", self._settings_tui, "settings"),
-            ("❓ Help", self._help_tui, "help"),
-            ("🚪 Exit", self._exit_tui, "exit")
-        ]
-
-    def _load_url_history(self) -> List[Dict[str, Any]]:
-        """Load URL history from file."""
+        self.menu_options = tuple(MenuItem.create(*option) for option in (
+            ("📥 Load Playlist", self._load_playlist_tui, OpType.URL),
+            ("📜 Load from History", self._load_from_history_tui, OpType.HISTORY),
+            ("📚 Load Multiple", self._load_multiple_tui, OpType.MULTIPLE),
+            ("📊 Playlist Overview", self._show_overview_tui, OpType.OVERVIEW),
+            ("📁 Group Analysis", self._show_groups_tui, OpType.GROUPS),
+            ("🏷️ TVG Tag Analysis", self._show_tags_tui, OpType.TAGS),
+            ("💾 Smart Export", self._export_tui, OpType.EXPORT),
+            ("🔀 Manage Playlists", self._manage_playlists_tui, OpType.MANAGE),
+            ("🔄 Merge Playlists", self._merge_tui, OpType.MERGE),
+            ("🎭 Series Detection", self._series_tui, OpType.SERIES),
+            ("🔍 Search Channels", self._search_tui, OpType.SEARCH),
+            ("⚙️ Settings", self._settings_tui, OpType.SETTINGS),
+            ("❓ Help", self._help_tui, OpType.HELP),
+            ("🚪 Exit", self._exit_tui, OpType.EXIT)
+        ))
+
+    @property
+    def console(self):
+        """The Rich console, created on first use (None when Textual is not installed)."""
+        if self._console is None and TEXTUAL_AVAILABLE:
+            self._console = Console()
+        return self._console
+
+    def _load_url_history(self) -> 'OrderedDict[str, Dict[str, Any]]':
+        """Load URL history from file, keyed by URL, most recent first."""
         try:
-            if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            data = self.history_file.read_bytes()
+            entries = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            return OrderedDict((entry['url'], entry) for entry in entries)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self._print_error(f"Failed to load URL history: {e}")
-        return []
+        return OrderedDict()
 
     def _save_url_history(self):
-        """Save URL history to file."""
+        """Save URL history to file, replacing the previous one atomically."""
+        entries = list(self.url_history.values())
+        tmp_file = self.history_file.with_suffix('.tmp')
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.url_history, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(entries)
+            else:
+                data = json.dumps(entries, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.history_file)
         except Exception as e:
             self._print_error(f"Failed to save URL history: {e}")
 
+    def _flush_history(self):
+        """Save URL history to file, only if it changed since it was last saved."""
+        if self._history_dirty:
+            self._history_dirty = False
+            self._save_url_history()
+
     def add_to_history(self, url: str, success: bool, channel_count: int = 0):
-        """Add URL to history."""
+        """Add URL to history (written to file by _flush_history)."""
         history_entry = {
             'url': url,
             'timestamp': time.time(),
             'success': success,
             'channel_count': channel_count,
-            'domain': urlparse(url).netloc
+            'domain': _netloc(url)
         }
         
-        self.url_history = [entry for entry in self.url_history if entry['url'] != url]
-        self.url_history.insert(0, history_entry)
-        self.url_history = self.url_history[:50]
-        self._save_url_history()
-
-    def load_playlist_from_url(self, url: str, sanitize: bool = True) -> bool:
-        """Load playlist from URL."""
-        # Note: In a true Textual app, this blocking call should be offloaded to a worker thread.
+        # Replace any previous entry of the URL and move it to the front
+        self.url_history.pop(url, None)
+        self.url_history[url] = history_entry
+        self.url_history.move_to_end(url, last=False)
+        while len(self.url_history) > 50:
+            self.url_history.popitem(last=True)
+        self._history_dirty = True
+        # Every load, successful or not, ends here
+        self.state_version += 1
+
+    def load_playlist_from_url(self, url: str, sanitize: bool = True, show_progress: bool = True) -> bool:
+        """Load playlist from URL.
+
+        This call blocks: under Textual the app rather runs _fetch_playlist in
+        a worker thread and _keep_playlist once it is done (see
+        IPTVTUI.action_select_option).
+        """
+        with self._create_progress() if show_progress else nullcontext() as progress:
+            pl = self._fetch_playlist(url, sanitize, progress)
+        self._keep_playlist(url, pl)
+        return pl is not None
+
+    def _fetch_playlist(self, url: str, sanitize: bool = True, progress=None) -> Optional[M3UPlaylist]:
+        """Download, parse and optionally sanitize a playlist, without keeping it.
+
+        The state of the backend is not touched, so this can run in a worker
+        thread. Errors are reported and give None.
+        """
         try:
-            with self._create_progress() as progress:
+            if progress:
                 task = progress.add_task(f"Loading {url[:50]}...", total=None)
-                pl = playlist.loadu(url)
-                
-                if sanitize and pl:
+            pl = playlist.loadu(url)
+            
+            if sanitize and pl:
+                if progress:
                     progress.update(task, description="Sanitizing playlist...")
-                    pl = M3UPlaylistDoctor.sanitize(pl)
-                
-                self.current_playlist = pl
-                domain = urlparse(url).netloc
-                playlist_name = f"{domain}_{time.strftime('%Y%m%d_%H%M%S')}"
-                self.loaded_playlists[playlist_name] = pl
-                self.add_to_history(url, True, pl.length() if pl else 0)
-                
-                return True
+                pl = M3UPlaylistDoctor.sanitize(pl)
+            return pl
                 
         except (URLException, MalformedPlaylistException) as e:
             self._print_error(f"Failed to load: {e}")
-            self.add_to_history(url, False)
-            return False
         except Exception as e:
             self._print_error(f"Unexpected error: {e}")
+        return None
+
+    def _keep_playlist(self, url: str, pl: Optional[M3UPlaylist]) -> None:
+        """Make a fetched playlist the current one and record the load in the history.
+
+        A None playlist records a failed load.
+        """
+        if pl is None:
             self.add_to_history(url, False)
-            return False
+            return
+        self.current_playlist = pl
+        domain = _netloc(url)
+        playlist_name = f"{domain}_{time.strftime('%Y%m%d_%H%M%S')}"
+        self.loaded_playlists[playlist_name] = pl
+        self.add_to_history(url, True, pl.length())
 
     def _create_progress(self):
         """Create a rich progress display for TUI."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -172,31 +295,43 @@ class IPTV_Backend:
 
     def _execute_menu_option(self, option_index: int):
         """Execute the selected menu option (called by Textual App)."""
-        option, handler, op_type = self.menu_options[option_index]
+        item = self.menu_options[option_index]
         
-        # Check prerequisites
-        if op_type in ["overview", "groups", "tags", "export", "series", "search"] and not self.current_playlist:
-            # In a Textual app, this should send a message to the App, not call _show_message directly
-            self._show_message("Action blocked: Please load a playlist first!", "error")
-            return
-        elif op_type == "merge" and len(self.loaded_playlists) < 2:
-            self._show_message("Action blocked: Need at least 2 playlists to merge!", "error")
-            return
-        elif op_type == "history" and not self.url_history:
-            self._show_message("Action blocked: No URL history available!", "error")
+        if item.op_type is OpType.EXIT:
+            # Textual handles the clean exit, just a placeholder
             return
-        elif op_type == "exit":
-             # Textual handles the clean exit, just a placeholder
-             return
+        
+        with self._view():
+            # Check prerequisites
+            if item.needs_playlist and not self.current_playlist:
+                # In a Textual app, this should send a message to the App, not call _show_message directly
+                self._show_message("Action blocked: Please load a playlist first!", "error")
+                return
+            elif item.needs_multiple and len(self.loaded_playlists) < 2:
+                self._show_message("Action blocked: Need at least 2 playlists to merge!", "error")
+                return
+            elif item.needs_history and not self.url_history:
+                self._show_message("Action blocked: No URL history available!", "error")
+                return
             
-        # Execute handler (these handlers still rely on rich.prompt/console for user interaction)
-        handler()
+            # Execute handler (these handlers still rely on rich.prompt/console for user interaction)
+            item.handler()
+
+    @contextmanager
+    def _view(self):
+        """Run a handler on the alternate screen, so it needs no clearing and leaves no output behind."""
+        if self.console:
+            with self.console.screen(hide_cursor=False):
+                yield
+        else:
+            yield
         
     def _load_playlist_tui(self):
         """TUI for loading playlists."""
-        # This implementation remains blocking, which is a future Textual refactor target.
+        # Only the prompts block: the playlist itself is loaded by the app in
+        # a worker thread, so the UI stays responsive during the download
         if self.console:
-            self.console.clear()
+            from rich.prompt import Prompt, Confirm
             
             url_panel = Panel(
                 "Enter playlist URL below:\n\n"
@@ -214,12 +349,7 @@ class IPTV_Backend:
                 return
                 
             sanitize = Confirm.ask("Sanitize playlist?", default=True)
-            
-            with self._create_progress() as progress:
-                if self.load_playlist_from_url(url, sanitize):
-                    self._show_message(f"✅ Loaded {self.current_playlist.length():,} channels!", "success")
-                else:
-                    self._show_message("❌ Failed to load playlist", "error")
+            self.pending_load = (url, sanitize)
 
     def _load_from_history_tui(self):
         self._show_message("Loading from history - functionality retained (blocking)", "info")
@@ -239,16 +369,14 @@ class IPTV_Backend:
     def _show_message(self, message: str, msg_type: str = "info"):
         """Show a message dialog."""
         # This will exit the Textual UI and return to the normal terminal
-        styles = {
-            "success": "green",
-            "error": "red", 
-            "warning": "yellow",
-            "info": "blue"
-        }
-        
         if self.console:
-            self.console.print(f"\n[{styles.get(msg_type, 'blue')}]{message}[/{styles.get(msg_type, 'blue')}]")
-            Prompt.ask("[dim]Press Enter to continue[/dim]")
+            color = _MESSAGE_COLORS.get(msg_type, "blue")
+            # The message and the prompt are printed together, and a bare
+            # ENTER needs none of Prompt's validation
+            try:
+                self.console.input(f"\n[{color}]{message}[/{color}]\n[dim]Press Enter to continue:[/dim] ")
+            except EOFError:
+                pass
         else:
             print(f"{message}")
 
@@ -284,12 +412,14 @@ class IPTV_Backend:
 
     def _exit_tui(self):
         """Clean exit from TUI."""
-        # Textual App handles the exit now, this is just a placeholder
-        pass 
+        # Textual App handles the exit now, only the history is left to save
+        self._flush_history()
 
     def _print_error(self, message: str):
         """Print error message."""
-        if self.console:
+        if self.error_handler is not None:
+            self.error_handler(f"❌ {message}")
+        elif self.console:
             self.console.print(f"[red]❌ {message}[/red]")
         else:
             print(f"❌ {message}")
@@ -298,62 +428,160 @@ class IPTV_Backend:
 # --- TEXTUAL UI COMPONENTS ---
 
 class MainMenu(Static):
-    """A custom Textual Widget to render the main menu table using rich."""
+    """A custom Textual Widget to render the main menu as rich Text rows.
+
+    Textual draws the border and the padding; the widget only renders the
+    option rows, laid out in columns like the table of the original menu.
+    """
+    
+    DEFAULT_CSS = """
+    MainMenu {
+        border: round ansi_cyan;
+        padding: 1 1;
+    }
+    """
     
-    # Textual's way of defining reactive state (like a property)
-    selected_option = 0
+    # Textual's way of defining reactive state (like a property): assigning
+    # it calls watch_selected_option, and Textual repaints just this widget
+    # on its next refresh
+    selected_option = reactive(0, init=False)
+    
+    # Joins the rows, which are cut rather than wrapped when the menu is narrow
+    _ROW_SEPARATOR = Text("\n", no_wrap=True, overflow="ellipsis")
     
     def __init__(self, backend: IPTV_Backend, **kwargs):
         super().__init__(**kwargs)
         self.backend = backend
         self.menu_options = self.backend.menu_options
+        # The selector and label columns of every option, unselected and
+        # selected, built once: a redraw only picks between them
+        label_width = max(cell_len(item.label) for item in self.menu_options)
+        self._option_cells = [
+            tuple(
+                Text.assemble(
+                    "  ", (selector.ljust(4), style), "   ",
+                    (item.label + " " * (label_width - cell_len(item.label)), style), "   "
+                )
+                for selector, style in ((" ", "white"), ("▶", "white bold reverse green"))
+            )
+            for item in self.menu_options
+        ]
+        # Status cells, rebuilt only when the backend state they show changes
+        self._state_version = None
+        self._status_sig = None
+        self._status_cells: List[Text] = []
+        # Complete rows, unselected and selected, for the current status
+        self._rows: List[Tuple[Text, Text]] = []
+        # The menu for each selected option, for the current status
+        self._rendered: Dict[int, Text] = {}
+        # True while a render is scheduled (see _schedule_render)
+        self._render_pending = False
 
     def watch_selected_option(self, old_value: int, new_value: int) -> None:
         """Called when selected_option changes. Triggers a re-render."""
+        self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        """Render the menu at the next frame, once for all the moves until then.
+
+        Holding an arrow key moves the selection faster than frames are
+        drawn, and the intermediate menus would never be seen.
+        """
+        if not self._render_pending:
+            self._render_pending = True
+            self.set_timer(_FRAME_INTERVAL, self._flush_render)
+
+    def _flush_render(self) -> None:
+        """Render the menu for the current selection.
+
+        While the terminal does not have the focus, the render is left
+        pending until it gets it back.
+        """
+        if not self.app.app_focus:
+            return
+        self._render_pending = False
         self.update(self._render_menu())
 
+    def _on_app_focus_changed(self, focus: bool) -> None:
+        """Catch up with a render left pending while the app was in the background."""
+        if focus and self._render_pending:
+            self._flush_render()
+
     def on_mount(self) -> None:
         """Called when the widget is first added to the App."""
         self.update(self._render_menu())
+        self.watch(self.app, "app_focus", self._on_app_focus_changed, init=False)
 
-    def _render_menu(self) -> str:
-        """Renders the menu using rich's formatting, similar to your original method."""
-        
-        menu_table = Table(show_header=False, box=box.SIMPLE, padding=(0, 1))
-        menu_table.add_column("", width=4)
-        menu_table.add_column("Option", style="white")
-        menu_table.add_column("Status", style="dim", width=15)
-        
-        for i, (option, handler, op_type) in enumerate(self.menu_options):
+    def _refresh_menu_status(self) -> None:
+        """Rebuild the status cells if the backend state they depend on has changed."""
+        backend = self.backend
+        if backend.state_version == self._state_version:
+            return
+        self._state_version = backend.state_version
+        status_sig = (
+            backend.current_playlist is not None,
+            len(backend.loaded_playlists) >= 2,
+            bool(backend.url_history)
+        )
+        if status_sig == self._status_sig:
+            return
+        has_playlist, has_multiple, has_history = status_sig
+        status_cells = []
+        for item in self.menu_options:
             # Status indicator (re-used from original logic)
-            if op_type in ["overview", "groups", "tags", "export", "series", "search"] and not self.backend.current_playlist:
-                status = "[red]need playlist[/red]"
-            elif op_type == "merge" and len(self.backend.loaded_playlists) < 2:
-                status = "[red]need 2+[/red]"
-            elif op_type == "history" and not self.backend.url_history:
-                status = "[dim]no history[/dim]"
+            if item.needs_playlist and not has_playlist:
+                status = Text("need playlist".ljust(15), style="dim red")
+            elif item.needs_multiple and not has_multiple:
+                status = Text("need 2+".ljust(15), style="dim red")
+            elif item.needs_history and not has_history:
+                status = Text("no history".ljust(15), style="dim")
             else:
-                status = "[dim]ready[/dim]"
-            
-            # Selection indicator
-            selector = "▶" if i == self.selected_option else " "
-            style = "bold reverse green" if i == self.selected_option else "white"
-            
-            menu_table.add_row(
-                f"[{style}]{selector}[/{style}]",
-                f"[{style}]{option}[/{style}]",
-                status
+                status = Text("ready".ljust(15), style="dim")
+            status_cells.append(status)
+        self._status_sig = status_sig
+        self._status_cells = status_cells
+        self._rows = [
+            (Text.assemble(unselected, status), Text.assemble(selected, status))
+            for (unselected, selected), status in zip(self._option_cells, status_cells)
+        ]
+        self._rendered.clear()
+
+    def _render_menu(self) -> Text:
+        """Renders the menu using rich's formatting, similar to your original method.
+
+        The rows are prebuilt, so rendering only joins them, once per
+        selected option until the status changes.
+        """
+        self._refresh_menu_status()
+        menu_text = self._rendered.get(self.selected_option)
+        if menu_text is None:
+            menu_text = self._rendered[self.selected_option] = self._ROW_SEPARATOR.join(
+                row[i == self.selected_option] for i, row in enumerate(self._rows)
             )
-        
-        # Use a Rich console capture to turn the Rich Panel/Table into a string for Textual's Static widget
-        menu_panel = Panel(menu_table, border_style="cyan")
-        
-        # Use the app's console or a dedicated console based on current size
-        console = Console(markup=True, width=self.app.size.width)
-        with console.capture() as capture:
-            console.print(menu_panel)
-            
-        return capture.get()
+        return menu_text
+
+class StatusHeader(Static):
+    """The status line above the menu, repainted only when one of its counts changes."""
+
+    # Channels in the current playlist (None when no playlist is loaded) and
+    # number of loaded playlists
+    channel_count = reactive(None)
+    playlist_count = reactive(0)
+
+    def render(self) -> Panel:
+        """Render the status line in its panel."""
+        header_text = Text()
+        header_text.append("🎯 MAIN MENU", style="bold bright_cyan")
+        header_text.append(" • ", style="dim")
+        if self.channel_count is not None:
+            header_text.append(f"📺 {self.channel_count:,} channels", style="green")
+        else:
+            header_text.append("⚠ No playlist loaded", style="yellow")
+        if self.playlist_count:
+            header_text.append(" • ", style="dim")
+            header_text.append(f"📚 {self.playlist_count} playlists", style="blue")
+        return Panel(header_text, border_style="bright_blue")
+
 
 # The main application class
 class IPTVTUI(App):
@@ -379,30 +607,15 @@ class IPTVTUI(App):
         self.manager = IPTV_Backend()
         self.menu_options = self.manager.menu_options
         self.main_menu_widget = MainMenu(self.manager, id="main_menu_widget")
+        self.status_header = StatusHeader(id="app_header_status")
         
     def compose(self) -> ComposeResult:
         """Create child widgets for the app (the layout)."""
         yield Header(show_clock=True)
         
         # Header with status (re-creating the header from your original script)
-        status_info = []
-        if self.manager.current_playlist:
-            status_info.append(f"[green]📺 {self.manager.current_playlist.length():,} channels[/green]")
-        else:
-            status_info.append("[yellow]⚠ No playlist loaded[/yellow]")
-            
-        if self.manager.loaded_playlists:
-            status_info.append(f"[blue]📚 {len(self.manager.loaded_playlists)} playlists[/blue]")
-            
-        header_text = Text()
-        header_text.append("🎯 MAIN MENU", style="bold bright_cyan")
-        if status_info:
-            header_text.append(" • " + " • ".join(status_info), style="dim")
-            
-        yield Static(
-            Panel(header_text, border_style="bright_blue"),
-            id="app_header_status"
-        )
+        yield self.status_header
+        self._sync_status_header()
         
         # The main menu body
         yield self.main_menu_widget
@@ -419,6 +632,26 @@ class IPTVTUI(App):
         
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Route backend errors to notifications and save the URL history regularly.
+
+        A crash then loses at most a few seconds of history.
+        """
+        self.manager.error_handler = self._notify_error
+        self.set_interval(_HISTORY_FLUSH_INTERVAL, self.manager._flush_history)
+
+    def on_unmount(self) -> None:
+        """Save the last history changes and let the backend print its errors again."""
+        self.manager._flush_history()
+        self.manager.error_handler = None
+
+    def _notify_error(self, message: str) -> None:
+        """Show a backend error as a notification, from the app or a worker thread."""
+        if threading.current_thread() is threading.main_thread():
+            self.notify(message, severity="error")
+        else:
+            self.call_from_thread(self.notify, message, severity="error")
+
     # --- Textual Action Handlers (Replaces _handle_menu_input) ---
     
     def action_cursor_up(self) -> None:
@@ -436,12 +669,70 @@ class IPTVTUI(App):
     def action_select_option(self) -> None:
         """Execute the currently selected menu option."""
         option_index = self.main_menu_widget.selected_option
+        if self.menu_options[option_index].op_type is OpType.URL and self._loading():
+            # A running thread worker cannot be cancelled, so one load at a time
+            self.notify("A playlist is still loading, please wait", severity="warning")
+            return
         
-        # Hand off execution to the backend manager
-        self.manager._execute_menu_option(option_index)
+        # Hand off execution to the backend manager, giving it the terminal
+        # while its (blocking) prompts run
+        with self.suspend():
+            self.manager._execute_menu_option(option_index)
+        
+        self._start_pending_load()
         
         # After a blocking action returns, re-render the main menu
         self.main_menu_widget.update(self.main_menu_widget._render_menu())
+
+    def _start_pending_load(self) -> None:
+        """Load the playlist asked for by the last menu option in a worker thread."""
+        if not self.manager.pending_load:
+            return
+        url, sanitize = self.manager.pending_load
+        self.manager.pending_load = None
+        self.notify(f"Loading {url[:50]}...", severity="information")
+        # An indeterminate bar, animated by Textual while the worker runs and
+        # removed once it ends (see on_worker_state_changed)
+        if not self.query("#load_progress"):
+            self.mount(ProgressBar(total=None, show_percentage=False, show_eta=False, id="load_progress"),
+                       before=self.main_menu_widget)
+        self.run_worker(partial(self._load_worker, url, sanitize), group="load", thread=True)
+
+    def _loading(self) -> bool:
+        """Tell whether a playlist load worker is still running."""
+        return any(worker.group == "load" and not worker.is_finished for worker in self.workers)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Remove the progress bar once the load worker ends, however it ends."""
+        if event.worker.group == "load" and event.state in (WorkerState.SUCCESS, WorkerState.ERROR,
+                                                              WorkerState.CANCELLED):
+            self.query("#load_progress").remove()
+
+    def _load_worker(self, url: str, sanitize: bool) -> None:
+        """Fetch a playlist in a worker thread, then hand it over to the UI thread.
+
+        Only the UI thread changes the state of the backend, which the menu
+        and the history flush read.
+        """
+        pl = self.manager._fetch_playlist(url, sanitize)
+        self.call_from_thread(self._on_playlist_loaded, url, pl)
+
+    def _on_playlist_loaded(self, url: str, pl: Optional[M3UPlaylist]) -> None:
+        """Keep a fetched playlist, report the result and show the new menu status."""
+        self.manager._keep_playlist(url, pl)
+        if pl is not None:
+            self.notify(f"✅ Loaded {pl.length():,} channels!", severity="information")
+        else:
+            self.notify("❌ Failed to load playlist", severity="error")
+        # The load may end while the terminal is in the background
+        self.main_menu_widget._schedule_render()
+        self._sync_status_header()
+
+    def _sync_status_header(self) -> None:
+        """Show the current playlist counts in the status header."""
+        pl = self.manager.current_playlist
+        self.status_header.channel_count = pl.length() if pl else None
+        self.status_header.playlist_count = len(self.manager.loaded_playlists)
         
     def action_quit(self) -> None:
         """Quit the application."""